@@ -2,18 +2,84 @@
 
 from __future__ import annotations
 
+import atexit
+import glob
+import math
+import os
 import platform
+import re
 import subprocess
 import threading
-from typing import List, Optional, Tuple
+import time
+from typing import Any, Dict, List, MutableSequence, Optional, Tuple
 
+import numpy as np
 import psutil
 
+# Resolved once at import: these are consulted on every UI refresh.
+_IS_WINDOWS = platform.system() == "Windows"
+_IS_LINUX = platform.system() == "Linux"
+_cpu_freq = getattr(psutil, "cpu_freq", None)
+_sensors_temps = getattr(psutil, "sensors_temperatures", None)
+
+
+class _State:
+    """Mutable state shared by the acquisition helpers of this module.
+
+    Kept on one slotted instance (``_STATE``) instead of loose module
+    globals, so the helpers need no ``global`` statements and fields that
+    are touched together live side by side.
+    """
+
+    __slots__ = (
+        "win_freqs",
+        "win_avg",
+        "win_thread",
+        "win_stamp",
+        "win_perf",
+        "win_base_mhz",
+        "win_freq_pdh",
+        "ps_proc",
+        "sysfs_freq_fds",
+        "hwmon_temp_fds",
+        "proc_stat_fd",
+        "proc_stat_prev",
+        "temp_val",
+        "temp_thread",
+    )
+
+    def __init__(self) -> None:
+        # Windows background frequency worker: latest result, the running
+        # thread and the monotonic time its last refresh completed.
+        self.win_freqs: Optional[List[float]] = None
+        self.win_avg: Optional[float] = None
+        self.win_thread: Optional[threading.Thread] = None
+        self.win_stamp = 0.0
+        # Long-lived Windows readers (PDH queries, PowerShell host).
+        self.win_perf: Any = None
+        self.win_base_mhz: Optional[float] = None
+        self.win_freq_pdh: Any = None
+        self.ps_proc: Optional[subprocess.Popen] = None
+        # Linux sysfs/hwmon descriptors.  ``None`` means not probed yet; an
+        # empty list means unavailable and psutil is used instead.
+        self.sysfs_freq_fds: Optional[List[int]] = None
+        self.hwmon_temp_fds: Optional[List[int]] = None
+        # ``/proc/stat`` descriptor (-1: unavailable) and the previous
+        # ``(cpu ids, total, idle)`` jiffy arrays used for the usage deltas.
+        self.proc_stat_fd: Optional[int] = None
+        self.proc_stat_prev: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        # Background temperature sampler.
+        self.temp_val: Optional[float] = None
+        self.temp_thread: Optional[threading.Thread] = None
+
+
+_STATE = _State()
+
 # ---------------------------------------------------------------------------
 # Windows specific setup for fast per-core frequency readings
 # ---------------------------------------------------------------------------
 
-if platform.system() == "Windows":
+if _IS_WINDOWS:
     import ctypes as C
     from ctypes import wintypes as W
 
@@ -64,7 +130,17 @@ if platform.system() == "Windows":
             return (n,)
 
     class PerCorePerfPDH:
-        """Persistent reader for % Processor Performance per core."""
+        """Persistent reader for a per-core PDH counter.
+
+        By default the ``% Processor Performance`` counter is sampled;
+        subclasses override :attr:`PATHS` to read other per-core counters
+        through the same long-lived query.
+        """
+
+        PATHS: Tuple[str, ...] = (
+            r"\Processor(*)\% Processor Performance",
+            r"\Processor Information(*)\% Processor Performance",
+        )
 
         def __init__(self) -> None:
             self.hQ = PDH_HQUERY()
@@ -72,32 +148,34 @@ if platform.system() == "Windows":
                 raise RuntimeError("PdhOpenQuery failed")
             self.hC = PDH_HCOUNTER()
             last = None
-            for path in (
-                r"\Processor(*)\% Processor Performance",
-                r"\Processor Information(*)\% Processor Performance",
-            ):
+            for path in self.PATHS:
                 res = PdhAddCounter(self.hQ, path, DWORD_PTR(0), C.byref(self.hC))
                 if res == 0:
                     self.path = path
                     break
                 last = res
             else:  # pragma: no cover - best effort
-                PdhCloseQuery(self.hQ)
+                self.close()
                 raise RuntimeError(f"AddCounter failed (last=0x{last:08X})")
             # Prime the query so subsequent reads are instantaneous
             if PdhCollectQueryData(self.hQ) != 0:
-                PdhCloseQuery(self.hQ)
+                self.close()
                 raise RuntimeError("PdhCollectQueryData prime failed")
             self.buf_size = W.DWORD(0)
             self.item_count = W.DWORD(0)
             self.raw = None
 
-        def __del__(self) -> None:  # pragma: no cover - invoked by GC
+        def close(self) -> None:
+            """Release the PDH query handle (safe to call more than once)."""
             if getattr(self, "hQ", None):
                 PdhCloseQuery(self.hQ)
+                self.hQ = None
 
-        def read_percent(self) -> dict:
-            """Return dict mapping core name to % Processor Performance."""
+        def __del__(self) -> None:  # pragma: no cover - invoked by GC
+            self.close()
+
+        def read_values(self) -> dict:
+            """Return dict mapping core name to the counter's current value."""
 
             if PdhCollectQueryData(self.hQ) != 0:
                 return {}
@@ -140,6 +218,19 @@ if platform.system() == "Windows":
                     out[it.szName] = float(it.FmtValue.doubleValue)
             return dict(sorted(out.items(), key=lambda kv: _core_key(kv[0])))
 
+        def read_percent(self) -> dict:
+            """Return dict mapping core name to % Processor Performance."""
+            return self.read_values()
+
+    class PerCoreFreqPDH(PerCorePerfPDH):
+        """Persistent reader for the per-core ``Processor Frequency`` counter.
+
+        This is the same counter the PowerShell fallback queries, read
+        in-process so no ``powershell.exe`` has to be spawned.
+        """
+
+        PATHS = (r"\Processor Information(*)\Processor Frequency",)
+
     def get_base_mhz_once() -> float:
         """Return the base processor frequency in MHz using PDH."""
 
@@ -179,19 +270,102 @@ if platform.system() == "Windows":
         raise RuntimeError("Cannot read base MHz")
 
 
-# Cache for Windows frequency fetching to avoid stalling the UI.  The
-# PowerShell call used as a fallback on Windows can take a noticeable
-# amount of time, so we run it in a background thread and keep the latest
-# result here.
-_win_freqs_cache: Tuple[Optional[List[float]], Optional[float]] = (None, None)
-_win_freqs_thread: Optional[threading.Thread] = None
-_win_perf: Optional["PerCorePerfPDH"] = None
-_win_base_mhz: Optional[float] = None
+# Windows frequencies are fetched in a background thread to avoid stalling
+# the UI; while the cached result is younger than this TTL no new worker is
+# started.
+_WIN_FREQS_TTL = 0.5
+
+
+def _close_windows_pdh() -> None:
+    """Close the long-lived PDH queries when the interpreter exits."""
+    for reader in (_STATE.win_perf, _STATE.win_freq_pdh):
+        if reader is not None:
+            try:
+                reader.close()
+            except Exception:
+                pass
+
+
+atexit.register(_close_windows_pdh)
+
+
+# PowerShell script for the fallback.  The samples are collected with a
+# ``foreach`` statement (no ``ForEach-Object`` pipeline stage) and joined
+# into a single newline-separated string, so PowerShell's output formatter
+# only ever sees one object.
+_PS_FREQ_SCRIPT = (
+    r"$s=(Get-Counter '\Processor Information(*)\Processor Frequency').CounterSamples;"
+    r" (foreach($c in $s){$c.InstanceName+'='+$c.CookedValue}) -join [char]10"
+)
+
+# ``<instance>=<value>`` lines printed by the PowerShell fallback.  Aggregate
+# instances (``_Total`` and per-group ``0,_Total``) are rejected by the
+# pattern itself so the parser is a single C-level scan.
+_FREQ_LINE_RE = re.compile(rb"(?im)^\s*(?![^=\r\n]*_total)[^=\r\n]+=\s*([-+\d.eE]+)\s*$")
+
+# A single PowerShell host is kept alive and fed scripts over stdin, so the
+# engine start-up (typically around a second) is paid once rather than on
+# every poll.  Each script is followed by a sentinel line marking the end of
+# its output.
+_PS_SENTINEL = b"__KLV_END__"
+_ps_lock = threading.Lock()
+
+
+def _powershell_run(script: str) -> bytes:
+    """Run ``script`` in the persistent PowerShell host and return its stdout.
+
+    The host is (re)spawned on demand when it is missing or has exited.
+    """
+    with _ps_lock:
+        proc = _STATE.ps_proc
+        if proc is None or proc.poll() is not None:
+            proc = _STATE.ps_proc = subprocess.Popen(
+                ["powershell", "-NoProfile", "-NonInteractive", "-Command", "-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                # No console window (and its allocation) for the hidden host.
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            )
+        proc.stdin.write(f"{script}; '{_PS_SENTINEL.decode()}'\r\n".encode())
+        proc.stdin.flush()
+        lines = []
+        for line in iter(proc.stdout.readline, b""):
+            if line.strip() == _PS_SENTINEL:
+                break
+            lines.append(line)
+        else:
+            # EOF before the sentinel: the host died, respawn on next call.
+            _STATE.ps_proc = None
+        return b"".join(lines)
+
+
+def _close_powershell() -> None:
+    """Terminate the persistent PowerShell host at interpreter exit."""
+    proc = _STATE.ps_proc
+    if proc is not None and proc.poll() is None:
+        try:
+            proc.kill()
+        except Exception:
+            pass
+
+
+atexit.register(_close_powershell)
+
+
+_cpu_counts: Dict[bool, int] = {}
 
 
 def count(logical: bool = True) -> int:
-    """Return the number of CPUs available on the system."""
-    return psutil.cpu_count(logical=logical) or 1
+    """Return the number of CPUs available on the system.
+
+    The value is cached per ``logical`` flag: the GUI sizes all of its
+    per-CPU buffers once, so re-querying psutil would only cost syscalls.
+    """
+    n = _cpu_counts.get(logical)
+    if n is None:
+        n = _cpu_counts[logical] = psutil.cpu_count(logical=logical) or 1
+    return n
 
 
 def percent(percpu: bool = True) -> List[float]:
@@ -206,32 +380,124 @@ def percent(percpu: bool = True) -> List[float]:
     return psutil.cpu_percent(interval=None, percpu=percpu)
 
 
+def percent_into(out: MutableSequence[float]) -> MutableSequence[float]:
+    """Write per-CPU usage into the preallocated buffer ``out`` and return it.
+
+    Negative readings are clamped to ``0.0`` and slots without a reading are
+    zeroed, so callers can keep one buffer alive across refreshes instead of
+    holding on to a fresh list every tick.  On Linux the usage is computed
+    from ``/proc/stat`` directly (see :func:`_linux_percent_into`).
+    """
+    if _IS_LINUX and _linux_percent_into(out):
+        return out
+    values = psutil.cpu_percent(interval=None, percpu=True)
+    n = min(len(values), len(out))
+    for i in range(n):
+        v = values[i]
+        out[i] = v if v > 0.0 else 0.0
+    for i in range(n, len(out)):
+        out[i] = 0.0
+    return out
+
+
+# Linux: per-CPU usage straight from ``/proc/stat``
+# ---------------------------------------------------------------------------
+
+# The file is opened once and re-read with a single positioned read per
+# refresh.  Only the ``cpuN`` lines at its top are parsed; psutil would also
+# build a namedtuple per CPU and per call.
+
+
+def _linux_percent_into(out: MutableSequence[float]) -> bool:
+    """Fill ``out`` from ``/proc/stat``; ``False`` when it cannot be read.
+
+    Usage is the non-idle share of the jiffies elapsed since the previous
+    call, as :func:`psutil.cpu_percent` computes it: idle and iowait count
+    as idle, guest time is already part of user time.
+    """
+    fd = _STATE.proc_stat_fd
+    if fd is None:
+        try:
+            fd = os.open("/proc/stat", os.O_RDONLY)
+        except OSError:
+            fd = -1
+        _STATE.proc_stat_fd = fd
+    if fd < 0:
+        return False
+    # The cpu lines come first; read just past them (the interrupt counters
+    # that follow can be large)
+    size = 128 * (len(out) + 2)
+    try:
+        data = os.pread(fd, size, 0)
+        while len(data) == size and b"\nintr" not in data:
+            size *= 2
+            data = os.pread(fd, size, 0)
+    except OSError:
+        return False
+
+    ids: List[int] = []
+    rows: List[List[bytes]] = []
+    for line in data.split(b"\n")[1:]:  # skip the aggregate "cpu " line
+        if not line.startswith(b"cpu"):
+            break
+        fields = line.split()
+        ids.append(int(fields[0][3:]))
+        rows.append(fields[1:9])  # user .. steal
+    if not rows:
+        return False
+    try:
+        jiffies = np.array(rows, dtype=np.int64)
+    except ValueError:  # old kernels report fewer than eight columns
+        jiffies = np.array([r + [b"0"] * (8 - len(r)) for r in rows], dtype=np.int64)
+
+    # The deltas for every CPU are taken in a handful of array operations
+    cpu_ids = np.array(ids)
+    total = jiffies.sum(axis=1)
+    idle = jiffies[:, 3] + jiffies[:, 4]
+    prev = _STATE.proc_stat_prev
+    _STATE.proc_stat_prev = (cpu_ids, total, idle)
+    usage = np.zeros(len(out))
+    # After a CPU went on/offline the rows no longer line up: report zeros
+    # for one refresh, as on the very first call
+    if prev is not None and np.array_equal(prev[0], cpu_ids):
+        d_total = total - prev[1]
+        busy = np.maximum(d_total - (idle - prev[2]), 0)
+        pct = np.minimum(100.0 * busy / np.maximum(d_total, 1), 100.0)
+        keep = cpu_ids < len(out)
+        usage[cpu_ids[keep]] = pct[keep]
+    if isinstance(out, np.ndarray):
+        out[:] = usage
+    else:
+        out[:] = usage.tolist()
+    return True
+
+
+def _close_proc_stat_fd() -> None:
+    if _STATE.proc_stat_fd is not None and _STATE.proc_stat_fd >= 0:
+        try:
+            os.close(_STATE.proc_stat_fd)
+        except OSError:
+            pass
+
+
+atexit.register(_close_proc_stat_fd)
+
 
 def _windows_cpu_freqs_powershell() -> Tuple[Optional[List[float]], Optional[float]]:
-    """Slow PowerShell-based fallback for per-CPU frequencies."""
+    """PowerShell-based fallback for per-CPU frequencies.
+
+    Uses the persistent host from :func:`_powershell_run`.  Output stays as
+    raw bytes end to end: the byte pattern extracts the values and
+    ``float()`` parses them without any decode step.
+    """
 
     try:
-        cmd = [
-            "powershell",
-            "-NoProfile",
-            "-Command",
-            r"(Get-Counter '\Processor Information(*)\Processor Frequency').CounterSamples | ForEach-Object { $_.InstanceName = $_.CookedValue }",
-        ]
-        out = subprocess.check_output(cmd, text=True)
-        freqs: List[float] = []
-        for line in out.strip().splitlines():
-            line = line.strip()
-            if not line or "=" not in line:
-                continue
-            name, val = line.split("=", 1)
-            if name.strip().lower() == "_total":
-                continue
-            try:
-                freqs.append(float(val))
-            except ValueError:
-                pass
+        out = _powershell_run(_PS_FREQ_SCRIPT)
+        # findall() returns an exactly sized list and map/list() consume it
+        # in C, so there is no incremental append (or resize) to pre-size.
+        freqs = list(map(float, _FREQ_LINE_RE.findall(out)))
         if freqs:
-            avg = sum(freqs) / len(freqs)
+            avg = math.fsum(freqs) / len(freqs)
             return freqs, avg
     except Exception:
         pass
@@ -239,84 +505,308 @@ def _windows_cpu_freqs_powershell() -> Tuple[Optional[List[float]], Optional[flo
 
 
 def _windows_cpu_freqs() -> Tuple[Optional[List[float]], Optional[float]]:
-    """Fetch per-CPU frequencies on Windows using PDH with PowerShell fallback."""
+    """Fetch per-CPU frequencies on Windows using PDH with PowerShell fallback.
+
+    The preferred reading scales ``% Processor Performance`` by the base
+    frequency (this reflects turbo boost).  When that is unavailable the
+    ``Processor Frequency`` counter is read through a persistent PDH query,
+    and only if PDH cannot be used at all is PowerShell spawned.
+    """
 
-    global _win_perf, _win_base_mhz
+    st = _STATE
     try:
-        if _win_perf is None:
-            _win_perf = PerCorePerfPDH()
-        if _win_base_mhz is None:
-            _win_base_mhz = get_base_mhz_once()
-        perc = _win_perf.read_percent()
-        if perc and _win_base_mhz:
-            per_core = [_win_base_mhz * (val / 100.0) for val in perc.values()]
+        if st.win_perf is None:
+            st.win_perf = PerCorePerfPDH()
+        if st.win_base_mhz is None:
+            st.win_base_mhz = get_base_mhz_once()
+        perc = st.win_perf.read_percent()
+        base_mhz = st.win_base_mhz
+        if perc and base_mhz:
+            per_core = [base_mhz * (val / 100.0) for val in perc.values()]
             if per_core:
                 avg = sum(per_core) / len(per_core)
                 return per_core, avg
     except Exception:
-        _win_perf = None
-        _win_base_mhz = None
+        st.win_perf = None
+        st.win_base_mhz = None
+
+    try:
+        if st.win_freq_pdh is None:
+            st.win_freq_pdh = PerCoreFreqPDH()
+        per_core = [mhz for mhz in st.win_freq_pdh.read_values().values() if mhz > 0]
+        if per_core:
+            return per_core, sum(per_core) / len(per_core)
+    except Exception:
+        st.win_freq_pdh = None
 
     return _windows_cpu_freqs_powershell()
 
 
 
 def _windows_freq_worker() -> None:
-    global _win_freqs_cache, _win_freqs_thread
-    _win_freqs_cache = _windows_cpu_freqs()
-    _win_freqs_thread = None
+    st = _STATE
+    st.win_freqs, st.win_avg = _windows_cpu_freqs()
+    st.win_stamp = time.monotonic()
+    st.win_thread = None
 
 
 def _schedule_windows_freqs() -> None:
-    global _win_freqs_thread
-    if _win_freqs_thread is None or not _win_freqs_thread.is_alive():
-        _win_freqs_thread = threading.Thread(target=_windows_freq_worker, daemon=True)
-        _win_freqs_thread.start()
+    st = _STATE
+    if time.monotonic() - st.win_stamp < _WIN_FREQS_TTL:
+        return
+    if st.win_thread is None or not st.win_thread.is_alive():
+        st.win_thread = threading.Thread(target=_windows_freq_worker, daemon=True)
+        st.win_thread.start()
+
+
+# ---------------------------------------------------------------------------
+# Linux: read ``scaling_cur_freq`` straight from sysfs
+# ---------------------------------------------------------------------------
+
+# File descriptors for ``cpuN/cpufreq/scaling_cur_freq`` ordered by N are
+# opened on first use and kept in ``_STATE.sysfs_freq_fds`` for the lifetime
+# of the process.
+
+
+def _open_sysfs_freq_fds() -> List[int]:
+    """Open the per-CPU ``scaling_cur_freq`` files once."""
+    paths = glob.glob("/sys/devices/system/cpu/cpu[0-9]*/cpufreq/scaling_cur_freq")
+    paths.sort(key=lambda p: int(p.split("/")[5][3:]))
+    fds: List[int] = []
+    try:
+        for path in paths:
+            fds.append(os.open(path, os.O_RDONLY))
+    except OSError:
+        _close_fds(fds)
+        return []
+    return fds
+
+
+def _close_fds(fds: List[int]) -> None:
+    for fd in fds:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+def _close_sysfs_freq_fds() -> None:
+    """Close the cached sysfs descriptors when the interpreter exits."""
+    if _STATE.sysfs_freq_fds:
+        _close_fds(_STATE.sysfs_freq_fds)
+
+
+atexit.register(_close_sysfs_freq_fds)
+
+
+def _linux_cpu_freqs(n_cpu: int) -> Tuple[Optional[List[float]], Optional[float]]:
+    """Return per-CPU and average MHz read directly from sysfs."""
+    fds = _STATE.sysfs_freq_fds
+    if fds is None:
+        fds = _STATE.sysfs_freq_fds = _open_sysfs_freq_fds()
+    if not fds:
+        return None, None
+    pread = os.pread
+    # sysfs values are non-negative kHz integers; one positioned read per
+    # core (no seek) and the reduction is left to C-level builtins.
+    per_freq_mhz = [int(pread(fd, 32, 0)) / 1000.0 for fd in fds[:n_cpu]]
+    n_valid = len(per_freq_mhz) - per_freq_mhz.count(0.0)
+    return per_freq_mhz, (sum(per_freq_mhz) / n_valid if n_valid else None)
 
 
 def freqs(n_cpu: int) -> Tuple[Optional[List[float]], Optional[float]]:
     """Return per-CPU and average frequency in MHz.
 
-    The function tries :func:`psutil.cpu_freq` first.  On Windows a
-    PDH-based reader (with a slower PowerShell fallback) is scheduled in
-    the background to provide accurate readings without blocking the
-    caller.
+    The function tries :func:`psutil.cpu_freq` first.  On Windows, where
+    psutil usually reports a single aggregate value, a PDH-based reader
+    (with a slower PowerShell fallback) is scheduled in the background to
+    provide accurate per-core readings without blocking the caller.  The
+    Windows path is skipped entirely when psutil already returned one
+    non-zero reading per CPU.  On Linux the ``scaling_cur_freq`` sysfs
+    files are read directly, bypassing psutil's per-call directory walk.
     """
-    per_freq_mhz: Optional[List[float]] = None
-    avg_freq: Optional[float] = None
+    if _IS_LINUX:
+        try:
+            per_freq_mhz, avg_freq = _linux_cpu_freqs(n_cpu)
+            if per_freq_mhz:
+                return per_freq_mhz, avg_freq
+        except Exception:
+            pass
+
+    per_freq_mhz = None
+    avg_freq = None
     try:
-        freqs = psutil.cpu_freq(percpu=True)
+        freqs = _cpu_freq(percpu=True) if _cpu_freq is not None else None
         if freqs:
-            per_freq_mhz = [max(0.0, getattr(f, "current", 0.0)) for f in freqs[:n_cpu]]
-            valid = [f for f in per_freq_mhz if f and f > 0]
-            if valid:
-                avg_freq = sum(valid) / len(valid)
+            # Single pass: build the per-CPU list and accumulate the average
+            # of the valid (positive) readings at the same time.
+            per_freq_mhz = []
+            total = 0.0
+            n_valid = 0
+            for f in freqs[:n_cpu]:
+                cur = f.current
+                if cur > 0:
+                    total += cur
+                    n_valid += 1
+                else:
+                    cur = 0.0
+                per_freq_mhz.append(cur)
+            if n_valid:
+                avg_freq = total / n_valid
     except Exception:
         pass
 
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
+        if per_freq_mhz and len(per_freq_mhz) >= n_cpu and any(per_freq_mhz):
+            return per_freq_mhz, avg_freq
         _schedule_windows_freqs()
-        win_freqs, win_avg = _win_freqs_cache
+        win_freqs = _STATE.win_freqs
         if win_freqs:
             per_freq_mhz = win_freqs[:n_cpu]
-            avg_freq = win_avg
+            avg_freq = _STATE.win_avg
     return per_freq_mhz, avg_freq
 
 
+# ``psutil.sensors_temperatures`` globs every hwmon device on Linux and can
+# take well over 100 ms, so it is polled by a daemon thread and callers only
+# ever read the last reduced value.
+_temp_stop = threading.Event()
+_TEMP_TTL = 1.0
+# Chips known to report the CPU package/cores.  Other sensors (NVMe, ACPI,
+# Wi-Fi...) are only considered when none of these is present.
+_CPU_CHIPS = ("coretemp", "k10temp", "zenpower", "cpu_thermal")
+
+# Linux: the ``temp*_input`` descriptors of the CPU hwmon chips are opened on
+# the first sample and kept in ``_STATE.hwmon_temp_fds``.
+_HWMON_INPUT_RE = re.compile(r"temp\d+_input$")
+
+atexit.register(_temp_stop.set)
+
+
+def _open_hwmon_temp_fds() -> List[int]:
+    """Open the temperature inputs of every CPU chip under ``/sys/class/hwmon``."""
+    fds: List[int] = []
+    try:
+        for hw in os.scandir("/sys/class/hwmon"):
+            try:
+                with open(os.path.join(hw.path, "name")) as fh:
+                    if fh.read().strip() not in _CPU_CHIPS:
+                        continue
+                for entry in os.scandir(hw.path):
+                    if _HWMON_INPUT_RE.match(entry.name):
+                        fds.append(os.open(entry.path, os.O_RDONLY))
+            except OSError:
+                continue
+    except OSError:
+        pass
+    return fds
+
+
+def _close_hwmon_temp_fds() -> None:
+    """Close the cached hwmon descriptors when the interpreter exits."""
+    if _STATE.hwmon_temp_fds:
+        _close_fds(_STATE.hwmon_temp_fds)
+
+
+atexit.register(_close_hwmon_temp_fds)
+
+
+def _linux_temperature() -> Optional[float]:
+    """Return the CPU maximum read straight from the cached hwmon inputs."""
+    fds = _STATE.hwmon_temp_fds
+    if fds is None:
+        fds = _STATE.hwmon_temp_fds = _open_hwmon_temp_fds()
+    if not fds:
+        return None
+    pread = os.pread
+    # Values are in millidegrees Celsius.
+    return max(int(pread(fd, 16, 0)) for fd in fds) / 1000.0
+
+
+def _temperature_worker() -> None:
+    st = _STATE
+    while True:
+        st.temp_val = _read_temperature()
+        if _temp_stop.wait(_TEMP_TTL):
+            break
+
+
 def temperature() -> Optional[float]:
-    """Return the highest available CPU temperature in Celsius."""
+    """Return the highest available CPU temperature in Celsius.
+
+    The value comes from a background sampler refreshed every
+    ``_TEMP_TTL`` seconds, so this never blocks.  The sampler is started
+    lazily; until its first reading completes ``None`` is returned.
+    """
+    if _sensors_temps is None:
+        return None
+    st = _STATE
+    if st.temp_thread is None or not st.temp_thread.is_alive():
+        st.temp_thread = threading.Thread(target=_temperature_worker, daemon=True)
+        st.temp_thread.start()
+    return st.temp_val
+
+
+def _read_temperature() -> Optional[float]:
+    """Reduce the CPU sensor readings to a single maximum.
+
+    On Linux the hwmon inputs of known CPU chips are read directly; psutil
+    (which walks every hwmon device and re-reads its labels) is only used
+    when none is found or a read fails.
+    """
+    if _IS_LINUX:
+        try:
+            val = _linux_temperature()
+            if val is not None:
+                return val
+        except Exception:
+            pass
     try:
-        temps = psutil.sensors_temperatures()
+        temps = _sensors_temps()
     except Exception:
         return None
     if not temps:
         return None
-    max_temp = None
-    for entries in temps.values():
-        for t in entries:
-            cur = getattr(t, "current", None)
-            if cur is None:
-                continue
-            if max_temp is None or cur > max_temp:
-                max_temp = cur
-    return max_temp
+    groups = [v for k, v in temps.items() if k in _CPU_CHIPS] or temps.values()
+    return max(
+        (
+            cur
+            for entries in groups
+            for t in entries
+            if (cur := getattr(t, "current", None)) is not None
+        ),
+        default=None,
+    )
+
+
+def sample(
+    n_cpu: int,
+    with_percent: bool = True,
+    with_freqs: bool = True,
+    with_temperature: bool = False,
+    percent_out: Optional[MutableSequence[float]] = None,
+) -> Dict[str, Any]:
+    """Collect the CPU metrics needed for one UI refresh in a single call.
+
+    Returns a dict with ``"percent"`` (per-CPU usage), ``"freqs"`` (the
+    ``(per_cpu, average)`` tuple from :func:`freqs`) and ``"temperature"``.
+    Metrics that were not requested are ``None`` (``(None, None)`` for
+    ``"freqs"``) so callers can unpack the result unconditionally.  When
+    ``percent_out`` is given the usage is written into it via
+    :func:`percent_into` and that same buffer is returned as ``"percent"``.
+    """
+    # The calls run back to back on purpose: none of them blocks (the slow
+    # sources -- Windows counters, psutil's hwmon walk -- are polled by
+    # background workers and only their cached results are read here), so
+    # fanning them out to a thread pool would only add hand-off latency.
+    if not with_percent:
+        pct = None
+    elif percent_out is None:
+        pct = percent(percpu=True)
+    else:
+        pct = percent_into(percent_out)
+    return {
+        "percent": pct,
+        "freqs": freqs(n_cpu) if with_freqs else (None, None),
+        "temperature": temperature() if with_temperature else None,
+    }
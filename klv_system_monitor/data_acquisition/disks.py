@@ -2,18 +2,46 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
-from ..list_disks import disk_io_counters, safe_partitions
+from ..list_disks import (
+    USAGE_SKIPPED,
+    USAGE_TIMED_OUT,
+    disk_io_counters,
+    disk_io_totals,
+    mounted_partitions,
+    safe_partitions,
+)
 
-__all__ = ["partitions", "io_counters"]
+__all__ = [
+    "mounts", "partitions", "io_counters", "io_totals", "USAGE_SKIPPED", "USAGE_TIMED_OUT",
+]
 
 
-def partitions():
-    """Return a list of mounted partitions."""
-    return safe_partitions()
+def mounts() -> List[Tuple[str, str, str]]:
+    """Return (device, mountpoint, fstype) for mounted partitions, no usage."""
+    return mounted_partitions()
+
+
+def partitions(
+    mount_list: Optional[List[Tuple[str, str, str]]] = None,
+    probe_slow: bool = False,
+):
+    """Return a list of mounted partitions with their usage.
+
+    Each entry is ``(device, mountpoint, fstype, usage, reason)``.  Pass a
+    cached :func:`mounts` result to skip re-enumerating partitions.  When
+    usage is ``None``, *reason* is USAGE_SKIPPED (network mount, unless
+    *probe_slow* is set) or USAGE_TIMED_OUT.
+    """
+    return safe_partitions(mount_list, probe_slow)
 
 
 def io_counters() -> Dict[str, object]:
     """Return per-disk I/O statistics."""
     return disk_io_counters()
+
+
+def io_totals() -> Dict[str, Tuple[Optional[int], ...]]:
+    """Return per-disk I/O totals as tuples ordered like ``DISK_IO_FIELDS``."""
+    return disk_io_totals()
@@ -2,14 +2,86 @@
 
 from __future__ import annotations
 
+import atexit
+import os
+import platform
 import time
-from typing import Tuple
+from collections import namedtuple
+from typing import Optional, Tuple
 
 import psutil
 
+_IS_LINUX = platform.system() == "Linux"
+
+# On Linux the counters are read straight from /proc/net/dev through a file
+# descriptor kept open for the life of the process (pread from offset 0
+# returns fresh contents).  ``None``: not opened yet; ``-1``: unavailable,
+# psutil is used instead.
+_proc_net_fd: Optional[int] = None
+
+# Same fields and order as psutil.net_io_counters() returns
+NetIO = namedtuple(
+    "NetIO",
+    "bytes_sent bytes_recv packets_sent packets_recv errin errout dropin dropout",
+)
+
+
+def _linux_io_counters() -> Optional[NetIO]:
+    """Sum the per-interface counters of ``/proc/net/dev`` (as psutil does)."""
+    global _proc_net_fd
+    if _proc_net_fd is None:
+        try:
+            _proc_net_fd = os.open("/proc/net/dev", os.O_RDONLY)
+        except OSError:
+            _proc_net_fd = -1
+    if _proc_net_fd < 0:
+        return None
+    # A seq_file hands out about one page per read: read on until EOF
+    chunks = []
+    offset = 0
+    try:
+        while True:
+            chunk = os.pread(_proc_net_fd, 65536, offset)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            offset += len(chunk)
+    except OSError:
+        return None
+    data = b"".join(chunks)
+
+    # Receive: bytes packets errs drop ...; transmit (from field 8): bytes packets errs drop
+    totals = [0] * 8
+    for line in data.split(b"\n")[2:]:  # two header lines
+        _, sep, rest = line.partition(b":")
+        if not sep:
+            continue
+        f = rest.split()
+        if len(f) < 12:
+            continue
+        for i, field in enumerate(f[0:4] + f[8:12]):
+            totals[i] += int(field)
+    rx_b, rx_p, rx_e, rx_d, tx_b, tx_p, tx_e, tx_d = totals
+    return NetIO(tx_b, rx_b, tx_p, rx_p, rx_e, tx_e, rx_d, tx_d)
+
+
+def _close_proc_net_fd() -> None:
+    if _proc_net_fd is not None and _proc_net_fd >= 0:
+        try:
+            os.close(_proc_net_fd)
+        except OSError:
+            pass
+
+
+atexit.register(_close_proc_net_fd)
+
 
 def io_counters():
     """Return aggregated network I/O counters."""
+    if _IS_LINUX:
+        counters = _linux_io_counters()
+        if counters is not None:
+            return counters
     return psutil.net_io_counters(pernic=False)
 
 
@@ -25,7 +97,9 @@ def rates(prev, prev_time: float) -> Tuple[float, float, psutil._common.snetio,
     """
     now = time.monotonic()
     dt = max(1e-6, now - prev_time)
-    cur = psutil.net_io_counters(pernic=False)
-    rx_kib = (cur.bytes_recv - prev.bytes_recv) / 1024.0 / dt
-    tx_kib = (cur.bytes_sent - prev.bytes_sent) / 1024.0 / dt
+    cur = io_counters()
+    # An interface going away lowers the totals; report no traffic rather
+    # than a negative rate
+    rx_kib = max(0.0, (cur.bytes_recv - prev.bytes_recv) / 1024.0 / dt)
+    tx_kib = max(0.0, (cur.bytes_sent - prev.bytes_sent) / 1024.0 / dt)
     return rx_kib, tx_kib, cur, now
@@ -23,9 +23,11 @@ def kill(pid: int) -> None:
 
 
 def prime_cpu_percent() -> None:
-    """Warm up per-process CPU percentage measurements."""
-    for p in psutil.process_iter(["pid"]):
-        try:
-            p.cpu_percent(None)
-        except Exception:
-            pass
+    """Warm up per-process CPU percentage measurements.
+
+    Requesting ``cpu_percent`` through ``process_iter`` goes via
+    ``Process.as_dict()``, i.e. inside ``Process.oneshot()``, and psutil
+    already swallows processes that vanish or deny access.
+    """
+    for _ in psutil.process_iter(["cpu_percent"]):
+        pass
@@ -14,25 +14,32 @@
 #   - Processes tab refreshes only when visible and its interval is configurable.
 #   - Processes tab adds buttons to clear the selection and kill processes.
 #
-# Dependencies: psutil, PyQt5, pyqtgraph
+# Dependencies: psutil, PyQt5, pyqtgraph, numpy
 # License: MIT (adjust as desired)
 
 import sys
 import time
 import json
-from collections import deque
+import functools
+from collections.abc import Mapping
 from typing import Dict, Tuple, List, Optional
 from pathlib import Path
 
 import platform
-import threading
 import os
+import numpy as np
 from PyQt5 import QtWidgets, QtCore, QtGui
 import pyqtgraph as pg
 
+try:  # segment batching helper used by PlotCurveItem (pyqtgraph >= 0.13)
+    from pyqtgraph.graphicsItems.PlotCurveItem import arrayToLineSegments
+except ImportError:  # pragma: no cover - depends on the pyqtgraph version
+    arrayToLineSegments = None
+
 # Data acquisition helpers are kept separate from the GUI layer so that
 # all system queries live outside of this module.
 from .data_acquisition import cpu, memory, network, processes, disks
+from .smoothing import double_ema
 
 # Directory used to store persistent user preferences
 PREF_DIR = Path(__file__).resolve().parent / "user_preferences"
@@ -47,20 +54,56 @@ IS_LINUX = platform.system() == "Linux"
 
 # ------------------------------- Utilities -------------------------------
 
-def human_bytes(n: float) -> str:
+_BYTE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB", "PiB")
+
+
+# Formatting helpers are memoized: table refreshes format the same totals
+# (and lots of zeros) tick after tick.
+@functools.lru_cache(maxsize=8192)
+def human_bytes(n: int) -> str:
     """Format bytes in binary units (KiB, MiB, GiB...)."""
-    units = ["B", "KiB", "MiB", "GiB", "TiB", "PiB"]
-    i = 0
     n = float(n)
-    while n >= 1024 and i < len(units) - 1:
-        n /= 1024.0
-        i += 1
-    return (f"{n:,.0f} {units[i]}" if n >= 100 else f"{n:,.1f} {units[i]}").replace(",", " ")
+    # Unit index straight from the bit length (10 bits per step), no loop
+    i = min((int(n).bit_length() - 1) // 10, 5) if n >= 1024 else 0
+    v = n / (1 << (10 * i))
+    # Only values that round to >= 1000 can pick up a thousands separator
+    if v >= 999.5:
+        return f"{v:,.0f} {_BYTE_UNITS[i]}".replace(",", " ")
+    if v >= 100:
+        return f"{v:.0f} {_BYTE_UNITS[i]}"
+    return f"{v:.1f} {_BYTE_UNITS[i]}"
 
 def human_rate_kib(n_kib_s: float) -> str:
     """Format a rate given in KiB/s (switch to MiB/s above 1 MiB/s)."""
+    # Quantized to the displayed precision (round() and "%f" round the same
+    # way) so the cache can hit without changing the printed digits
     n = float(n_kib_s)
-    return (f"{n/1024.0:,.2f} MiB/s" if n >= 1024 else f"{n:,.1f} KiB/s").replace(",", " ")
+    if n >= 1024:
+        return _human_rate_mib(round(n / 1024.0, 2))
+    return _human_rate_kib(round(n, 1))
+
+@functools.lru_cache(maxsize=4096)
+def _human_rate_kib(n: float) -> str:
+    # Common case: no thousands separator.  999.95 and up already print
+    # as "1 000.0"
+    if n < 999.95:
+        return "%.1f KiB/s" % n
+    return f"{n:,.1f} KiB/s".replace(",", " ")
+
+@functools.lru_cache(maxsize=4096)
+def _human_rate_mib(n: float) -> str:
+    return f"{n:,.2f} MiB/s".replace(",", " ")
+
+@functools.lru_cache(maxsize=4096)
+def fixed2(v: float) -> str:
+    """``"%.2f" % v``, cached: table cells repeat the same values every tick."""
+    return "%.2f" % v
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Replace *path* with *text* so readers never see a half-written file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
 
 def human_freq(mhz: Optional[float]) -> str:
     """Format frequency in MHz as MHz/GHz with sensible precision."""
@@ -68,292 +111,153 @@ def human_freq(mhz: Optional[float]) -> str:
         return "—"
     return f"{mhz/1000.0:.2f} GHz" if mhz >= 1000.0 else f"{mhz:.0f} MHz"
 
+def hue_wheel(n: int, s: float, v: float) -> np.ndarray:
+    """RGB rows (0–1) of *n* colors evenly spaced around the hue circle.
 
-def build_theme_dict() -> Dict[str, QtGui.QPalette]:
-    """Return dictionary mapping theme names to QPalettes."""
-    themes: Dict[str, QtGui.QPalette] = {}
-
-    deep = QtGui.QPalette()
-    deep.setColor(QtGui.QPalette.Window, QtGui.QColor(30, 30, 30))
-    deep.setColor(QtGui.QPalette.WindowText, QtGui.QColor(220, 220, 220))
-    deep.setColor(QtGui.QPalette.Base, QtGui.QColor(40, 40, 40))
-    deep.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(50, 50, 50))
-    deep.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor(255, 255, 220))
-    deep.setColor(QtGui.QPalette.ToolTipText, QtGui.QColor(0, 0, 0))
-    deep.setColor(QtGui.QPalette.Text, QtGui.QColor(220, 220, 220))
-    deep.setColor(QtGui.QPalette.Button, QtGui.QColor(45, 45, 45))
-    deep.setColor(QtGui.QPalette.ButtonText, QtGui.QColor(220, 220, 220))
-    deep.setColor(QtGui.QPalette.Highlight, QtGui.QColor(53, 132, 228))
-    deep.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor(255, 255, 255))
-    themes["Deep Dark"] = deep
-
-    dark_purple = QtGui.QPalette()
-    dark_purple.setColor(QtGui.QPalette.Window, QtGui.QColor(53, 53, 53))
-    dark_purple.setColor(QtGui.QPalette.WindowText, QtCore.Qt.white)
-    dark_purple.setColor(QtGui.QPalette.Base, QtGui.QColor(35, 35, 35))
-    dark_purple.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(53, 53, 53))
-    dark_purple.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor(65, 65, 65))
-    dark_purple.setColor(QtGui.QPalette.ToolTipText, QtCore.Qt.white)
-    dark_purple.setColor(QtGui.QPalette.Text, QtCore.Qt.white)
-    dark_purple.setColor(QtGui.QPalette.Button, QtGui.QColor(53, 53, 53))
-    dark_purple.setColor(QtGui.QPalette.ButtonText, QtCore.Qt.white)
-    dark_purple.setColor(QtGui.QPalette.Highlight, QtGui.QColor(142, 45, 197))
-    dark_purple.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-    themes["Dark-purple"] = dark_purple
-
-    dark_blue = QtGui.QPalette()
-    dark_blue.setColor(QtGui.QPalette.Window, QtGui.QColor(53, 53, 53))
-    dark_blue.setColor(QtGui.QPalette.WindowText, QtCore.Qt.white)
-    dark_blue.setColor(QtGui.QPalette.Base, QtGui.QColor(35, 35, 35))
-    dark_blue.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(53, 53, 53))
-    dark_blue.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor(65, 65, 65))
-    dark_blue.setColor(QtGui.QPalette.ToolTipText, QtCore.Qt.white)
-    dark_blue.setColor(QtGui.QPalette.Text, QtCore.Qt.white)
-    dark_blue.setColor(QtGui.QPalette.Button, QtGui.QColor(53, 53, 53))
-    dark_blue.setColor(QtGui.QPalette.ButtonText, QtCore.Qt.white)
-    dark_blue.setColor(QtGui.QPalette.Highlight, QtGui.QColor(65, 105, 225))
-    dark_blue.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-    themes["Dark-blue"] = dark_blue
-
-    dark_gold = QtGui.QPalette()
-    dark_gold.setColor(QtGui.QPalette.Window, QtGui.QColor(53, 53, 53))
-    dark_gold.setColor(QtGui.QPalette.WindowText, QtCore.Qt.white)
-    dark_gold.setColor(QtGui.QPalette.Base, QtGui.QColor(35, 35, 35))
-    dark_gold.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(53, 53, 53))
-    dark_gold.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor(65, 65, 65))
-    dark_gold.setColor(QtGui.QPalette.ToolTipText, QtCore.Qt.white)
-    dark_gold.setColor(QtGui.QPalette.Text, QtCore.Qt.white)
-    dark_gold.setColor(QtGui.QPalette.Button, QtGui.QColor(53, 53, 53))
-    dark_gold.setColor(QtGui.QPalette.ButtonText, QtCore.Qt.white)
-    dark_gold.setColor(QtGui.QPalette.Highlight, QtGui.QColor(255, 215, 0))
-    dark_gold.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-    themes["Dark-gold"] = dark_gold
-
-    light = QtGui.QPalette()
-    light.setColor(QtGui.QPalette.Window, QtGui.QColor(210, 210, 210)) 
-    light.setColor(QtGui.QPalette.WindowText, QtCore.Qt.black)
-    light.setColor(QtGui.QPalette.Base, QtGui.QColor(230, 230, 230))  
-    light.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(210, 210, 210))  
-    light.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor(230, 230, 230))
-    light.setColor(QtGui.QPalette.ToolTipText, QtCore.Qt.black)
-    light.setColor(QtGui.QPalette.Text, QtCore.Qt.black)
-    light.setColor(QtGui.QPalette.Button, QtGui.QColor(215, 215, 215))  
-    light.setColor(QtGui.QPalette.ButtonText, QtCore.Qt.black)
-    light.setColor(QtGui.QPalette.Highlight, QtGui.QColor(53, 132, 228)) 
-    light.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.white)
-    themes["Light"] = light
-
-    beige = QtGui.QPalette()
-    beige.setColor(QtGui.QPalette.Window, QtGui.QColor(239, 235, 222))
-    beige.setColor(QtGui.QPalette.WindowText, QtGui.QColor(62, 50, 39))
-    beige.setColor(QtGui.QPalette.Base, QtGui.QColor(252, 252, 252))
-    beige.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(239, 235, 222))
-    beige.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor(239, 235, 222))
-    beige.setColor(QtGui.QPalette.ToolTipText, QtGui.QColor(62, 50, 39))
-    beige.setColor(QtGui.QPalette.Text, QtGui.QColor(62, 50, 39))
-    beige.setColor(QtGui.QPalette.Button, QtGui.QColor(220, 210, 197))
-    beige.setColor(QtGui.QPalette.ButtonText, QtGui.QColor(62, 50, 39))
-    beige.setColor(QtGui.QPalette.Highlight, QtGui.QColor(193, 154, 107))
-    beige.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.white)
-    themes["Beige"] = beige
-
-    ocean_dark = QtGui.QPalette()
-    ocean_dark.setColor(QtGui.QPalette.Window, QtGui.QColor(38, 50, 56))
-    ocean_dark.setColor(QtGui.QPalette.WindowText, QtCore.Qt.white)
-    ocean_dark.setColor(QtGui.QPalette.Base, QtGui.QColor(69, 90, 100))
-    ocean_dark.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(55, 71, 79))
-    ocean_dark.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor(38, 50, 56))
-    ocean_dark.setColor(QtGui.QPalette.ToolTipText, QtCore.Qt.white)
-    ocean_dark.setColor(QtGui.QPalette.Text, QtCore.Qt.white)
-    ocean_dark.setColor(QtGui.QPalette.Button, QtGui.QColor(55, 71, 79))
-    ocean_dark.setColor(QtGui.QPalette.ButtonText, QtCore.Qt.white)
-    ocean_dark.setColor(QtGui.QPalette.Highlight, QtGui.QColor(0, 137, 123))
-    ocean_dark.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-    themes["Ocean dark"] = ocean_dark
-
-    ocean_light = QtGui.QPalette()
-    ocean_light.setColor(QtGui.QPalette.Window, QtGui.QColor(225, 238, 245))
-    ocean_light.setColor(QtGui.QPalette.WindowText, QtCore.Qt.black)
-    ocean_light.setColor(QtGui.QPalette.Base, QtGui.QColor(240, 248, 252))
-    ocean_light.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(230, 240, 247))
-    ocean_light.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor(215, 230, 240))
-    ocean_light.setColor(QtGui.QPalette.ToolTipText, QtCore.Qt.black)
-    ocean_light.setColor(QtGui.QPalette.Text, QtCore.Qt.black)
-    ocean_light.setColor(QtGui.QPalette.Button, QtGui.QColor(213, 234, 242))
-    ocean_light.setColor(QtGui.QPalette.ButtonText, QtCore.Qt.black)
-    ocean_light.setColor(QtGui.QPalette.Highlight, QtGui.QColor(0, 123, 167))
-    ocean_light.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.white)
-    themes["Ocean light"] = ocean_light
-
-    hc = QtGui.QPalette()
-    hc.setColor(QtGui.QPalette.Window, QtGui.QColor(0, 0, 0))
-    hc.setColor(QtGui.QPalette.WindowText, QtCore.Qt.white)
-    hc.setColor(QtGui.QPalette.Base, QtGui.QColor(0, 0, 0))
-    hc.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(55, 55, 55))
-    hc.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor(0, 0, 0))
-    hc.setColor(QtGui.QPalette.ToolTipText, QtCore.Qt.white)
-    hc.setColor(QtGui.QPalette.Text, QtCore.Qt.white)
-    hc.setColor(QtGui.QPalette.Button, QtGui.QColor(0, 0, 0))
-    hc.setColor(QtGui.QPalette.ButtonText, QtCore.Qt.white)
-    hc.setColor(QtGui.QPalette.Highlight, QtGui.QColor(255, 0, 0))
-    hc.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.white)
-    themes["Contrast"] = hc
-
-    hc_w = QtGui.QPalette()
-    hc_w.setColor(QtGui.QPalette.Window, QtCore.Qt.white)
-    hc_w.setColor(QtGui.QPalette.WindowText, QtCore.Qt.black)
-    hc_w.setColor(QtGui.QPalette.Base, QtCore.Qt.white)
-    hc_w.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(200, 200, 200))
-    hc_w.setColor(QtGui.QPalette.ToolTipBase, QtCore.Qt.white)
-    hc_w.setColor(QtGui.QPalette.ToolTipText, QtCore.Qt.black)
-    hc_w.setColor(QtGui.QPalette.Text, QtCore.Qt.black)
-    hc_w.setColor(QtGui.QPalette.Button, QtCore.Qt.white)
-    hc_w.setColor(QtGui.QPalette.ButtonText, QtCore.Qt.black)
-    hc_w.setColor(QtGui.QPalette.Highlight, QtCore.Qt.black)
-    hc_w.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.white)
-    themes["Contrast White"] = hc_w
-
-    moon = QtGui.QPalette()
-    moon.setColor(QtGui.QPalette.Window, QtGui.QColor(0, 43, 54))
-    moon.setColor(QtGui.QPalette.WindowText, QtGui.QColor(253, 246, 227))
-    moon.setColor(QtGui.QPalette.Base, QtGui.QColor(7, 54, 66))
-    moon.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(0, 43, 54))
-    moon.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor(7, 54, 66))
-    moon.setColor(QtGui.QPalette.ToolTipText, QtGui.QColor(253, 246, 227))
-    moon.setColor(QtGui.QPalette.Text, QtGui.QColor(253, 246, 227))
-    moon.setColor(QtGui.QPalette.Button, QtGui.QColor(7, 54, 66))
-    moon.setColor(QtGui.QPalette.ButtonText, QtGui.QColor(253, 246, 227))
-    moon.setColor(QtGui.QPalette.Highlight, QtGui.QColor(38, 139, 210))
-    moon.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-    themes["Moon"] = moon
-
-    solar = QtGui.QPalette()
-    solar.setColor(QtGui.QPalette.Window, QtGui.QColor(253, 246, 227))
-    solar.setColor(QtGui.QPalette.WindowText, QtGui.QColor(101, 123, 131))
-    solar.setColor(QtGui.QPalette.Base, QtGui.QColor(255, 250, 240))
-    solar.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(253, 246, 227))
-    solar.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor(238, 232, 213))
-    solar.setColor(QtGui.QPalette.ToolTipText, QtGui.QColor(88, 110, 117))
-    solar.setColor(QtGui.QPalette.Text, QtGui.QColor(88, 110, 117))
-    solar.setColor(QtGui.QPalette.Button, QtGui.QColor(238, 232, 213))
-    solar.setColor(QtGui.QPalette.ButtonText, QtGui.QColor(88, 110, 117))
-    solar.setColor(QtGui.QPalette.Highlight, QtGui.QColor(38, 139, 210))
-    solar.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.white)
-    themes["Solar"] = solar
-
-    cyber = QtGui.QPalette()
-    cyber.setColor(QtGui.QPalette.Window, QtGui.QColor(10, 10, 20))
-    cyber.setColor(QtGui.QPalette.WindowText, QtGui.QColor(0, 255, 255))
-    cyber.setColor(QtGui.QPalette.Base, QtGui.QColor(30, 30, 45))
-    cyber.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor(25, 25, 35))
-    cyber.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor(45, 45, 65))
-    cyber.setColor(QtGui.QPalette.ToolTipText, QtGui.QColor(255, 0, 255))
-    cyber.setColor(QtGui.QPalette.Text, QtGui.QColor(0, 255, 255))
-    cyber.setColor(QtGui.QPalette.Button, QtGui.QColor(40, 40, 55))
-    cyber.setColor(QtGui.QPalette.ButtonText, QtGui.QColor(255, 0, 255))
-    cyber.setColor(QtGui.QPalette.Highlight, QtGui.QColor(255, 0, 128))
-    cyber.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.white)
-    themes["Cyber"] = cyber
-
-    drac = QtGui.QPalette()
-    drac.setColor(QtGui.QPalette.Window, QtGui.QColor("#282a36"))
-    drac.setColor(QtGui.QPalette.WindowText, QtGui.QColor("#f8f8f2"))
-    drac.setColor(QtGui.QPalette.Base, QtGui.QColor("#1e1f29"))
-    drac.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor("#282a36"))
-    drac.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor("#44475a"))
-    drac.setColor(QtGui.QPalette.ToolTipText, QtGui.QColor("#f8f8f2"))
-    drac.setColor(QtGui.QPalette.Text, QtGui.QColor("#f8f8f2"))
-    drac.setColor(QtGui.QPalette.Button, QtGui.QColor("#44475a"))
-    drac.setColor(QtGui.QPalette.ButtonText, QtGui.QColor("#f8f8f2"))
-    drac.setColor(QtGui.QPalette.Highlight, QtGui.QColor("#bd93f9"))
-    drac.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-    themes["Dracula"] = drac
-
-    nord = QtGui.QPalette()
-    nord.setColor(QtGui.QPalette.Window, QtGui.QColor("#2e3440"))
-    nord.setColor(QtGui.QPalette.WindowText, QtGui.QColor("#d8dee9"))
-    nord.setColor(QtGui.QPalette.Base, QtGui.QColor("#3b4252"))
-    nord.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor("#434c5e"))
-    nord.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor("#4c566a"))
-    nord.setColor(QtGui.QPalette.ToolTipText, QtGui.QColor("#eceff4"))
-    nord.setColor(QtGui.QPalette.Text, QtGui.QColor("#e5e9f0"))
-    nord.setColor(QtGui.QPalette.Button, QtGui.QColor("#4c566a"))
-    nord.setColor(QtGui.QPalette.ButtonText, QtGui.QColor("#d8dee9"))
-    nord.setColor(QtGui.QPalette.Highlight, QtGui.QColor("#88c0d0"))
-    nord.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-    themes["Nord"] = nord
-
-    gruv = QtGui.QPalette()
-    gruv.setColor(QtGui.QPalette.Window, QtGui.QColor("#282828"))
-    gruv.setColor(QtGui.QPalette.WindowText, QtGui.QColor("#ebdbb2"))
-    gruv.setColor(QtGui.QPalette.Base, QtGui.QColor("#32302f"))
-    gruv.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor("#3c3836"))
-    gruv.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor("#504945"))
-    gruv.setColor(QtGui.QPalette.ToolTipText, QtGui.QColor("#fbf1c7"))
-    gruv.setColor(QtGui.QPalette.Text, QtGui.QColor("#ebdbb2"))
-    gruv.setColor(QtGui.QPalette.Button, QtGui.QColor("#504945"))
-    gruv.setColor(QtGui.QPalette.ButtonText, QtGui.QColor("#ebdbb2"))
-    gruv.setColor(QtGui.QPalette.Highlight, QtGui.QColor("#d79921"))
-    gruv.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-    themes["Gruvbox"] = gruv
-
-    mono = QtGui.QPalette()
-    mono.setColor(QtGui.QPalette.Window, QtGui.QColor("#272822"))
-    mono.setColor(QtGui.QPalette.WindowText, QtGui.QColor("#f8f8f2"))
-    mono.setColor(QtGui.QPalette.Base, QtGui.QColor("#1e1f1c"))
-    mono.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor("#272822"))
-    mono.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor("#3e3d32"))
-    mono.setColor(QtGui.QPalette.ToolTipText, QtGui.QColor("#f8f8f2"))
-    mono.setColor(QtGui.QPalette.Text, QtGui.QColor("#f8f8f2"))
-    mono.setColor(QtGui.QPalette.Button, QtGui.QColor("#3e3d32"))
-    mono.setColor(QtGui.QPalette.ButtonText, QtGui.QColor("#f8f8f2"))
-    mono.setColor(QtGui.QPalette.Highlight, QtGui.QColor("#a6e22e"))
-    mono.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-    themes["Monokai"] = mono
-
-    tokyo = QtGui.QPalette()
-    tokyo.setColor(QtGui.QPalette.Window, QtGui.QColor("#1a1b26"))
-    tokyo.setColor(QtGui.QPalette.WindowText, QtGui.QColor("#c0caf5"))
-    tokyo.setColor(QtGui.QPalette.Base, QtGui.QColor("#1f2335"))
-    tokyo.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor("#24283b"))
-    tokyo.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor("#414868"))
-    tokyo.setColor(QtGui.QPalette.ToolTipText, QtGui.QColor("#c0caf5"))
-    tokyo.setColor(QtGui.QPalette.Text, QtGui.QColor("#c0caf5"))
-    tokyo.setColor(QtGui.QPalette.Button, QtGui.QColor("#414868"))
-    tokyo.setColor(QtGui.QPalette.ButtonText, QtGui.QColor("#c0caf5"))
-    tokyo.setColor(QtGui.QPalette.Highlight, QtGui.QColor("#7aa2f7"))
-    tokyo.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.white)
-    themes["Tokyo"] = tokyo
-
-    mocha = QtGui.QPalette()
-    mocha.setColor(QtGui.QPalette.Window, QtGui.QColor("#1e1e2e"))
-    mocha.setColor(QtGui.QPalette.WindowText, QtGui.QColor("#cdd6f4"))
-    mocha.setColor(QtGui.QPalette.Base, QtGui.QColor("#181825"))
-    mocha.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor("#1e1e2e"))
-    mocha.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor("#313244"))
-    mocha.setColor(QtGui.QPalette.ToolTipText, QtGui.QColor("#cdd6f4"))
-    mocha.setColor(QtGui.QPalette.Text, QtGui.QColor("#cdd6f4"))
-    mocha.setColor(QtGui.QPalette.Button, QtGui.QColor("#313244"))
-    mocha.setColor(QtGui.QPalette.ButtonText, QtGui.QColor("#cdd6f4"))
-    mocha.setColor(QtGui.QPalette.Highlight, QtGui.QColor("#f38ba8"))
-    mocha.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-    themes["Mocha"] = mocha
-
-    pale = QtGui.QPalette()
-    pale.setColor(QtGui.QPalette.Window, QtGui.QColor("#292d3e"))
-    pale.setColor(QtGui.QPalette.WindowText, QtGui.QColor("#a6accd"))
-    pale.setColor(QtGui.QPalette.Base, QtGui.QColor("#1b1d2b"))
-    pale.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor("#222436"))
-    pale.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor("#444267"))
-    pale.setColor(QtGui.QPalette.ToolTipText, QtGui.QColor("#a6accd"))
-    pale.setColor(QtGui.QPalette.Text, QtGui.QColor("#a6accd"))
-    pale.setColor(QtGui.QPalette.Button, QtGui.QColor("#444267"))
-    pale.setColor(QtGui.QPalette.ButtonText, QtGui.QColor("#a6accd"))
-    pale.setColor(QtGui.QPalette.Highlight, QtGui.QColor("#82aaff"))
-    pale.setColor(QtGui.QPalette.HighlightedText, QtCore.Qt.black)
-    themes["Palenight"] = pale
-
-    return themes
+    Vectorised HSV→RGB with fixed saturation/value, matching
+    ``QColor.fromHsvF(i / n, s, v)`` for each ``i``.
+    """
+    h6 = np.arange(n, dtype=np.float64) * (6.0 / max(1, n))
+    k = (np.array([5.0, 3.0, 1.0]) + h6[:, None]) % 6.0
+    return v - v * s * np.clip(np.minimum(k, 4.0 - k), 0.0, 1.0)
+
+
+# Roles every theme defines, in the order of the colors in _THEME_SPECS
+_PALETTE_ROLES = (
+    QtGui.QPalette.Window, QtGui.QPalette.WindowText, QtGui.QPalette.Base,
+    QtGui.QPalette.AlternateBase, QtGui.QPalette.ToolTipBase,
+    QtGui.QPalette.ToolTipText, QtGui.QPalette.Text, QtGui.QPalette.Button,
+    QtGui.QPalette.ButtonText, QtGui.QPalette.Highlight,
+    QtGui.QPalette.HighlightedText,
+)
+
+# Theme name -> one color (RGB tuple or "#rrggbb") per _PALETTE_ROLES entry
+_THEME_SPECS: Dict[str, tuple] = {
+    "Deep Dark": (
+        (30, 30, 30), (220, 220, 220), (40, 40, 40), (50, 50, 50),
+        (255, 255, 220), (0, 0, 0), (220, 220, 220), (45, 45, 45),
+        (220, 220, 220), (53, 132, 228), (255, 255, 255),
+    ),
+    "Dark-purple": (
+        (53, 53, 53), (255, 255, 255), (35, 35, 35), (53, 53, 53),
+        (65, 65, 65), (255, 255, 255), (255, 255, 255), (53, 53, 53),
+        (255, 255, 255), (142, 45, 197), (0, 0, 0),
+    ),
+    "Dark-blue": (
+        (53, 53, 53), (255, 255, 255), (35, 35, 35), (53, 53, 53),
+        (65, 65, 65), (255, 255, 255), (255, 255, 255), (53, 53, 53),
+        (255, 255, 255), (65, 105, 225), (0, 0, 0),
+    ),
+    "Dark-gold": (
+        (53, 53, 53), (255, 255, 255), (35, 35, 35), (53, 53, 53),
+        (65, 65, 65), (255, 255, 255), (255, 255, 255), (53, 53, 53),
+        (255, 255, 255), (255, 215, 0), (0, 0, 0),
+    ),
+    "Light": (
+        (210, 210, 210), (0, 0, 0), (230, 230, 230), (210, 210, 210),
+        (230, 230, 230), (0, 0, 0), (0, 0, 0), (215, 215, 215), (0, 0, 0),
+        (53, 132, 228), (255, 255, 255),
+    ),
+    "Beige": (
+        (239, 235, 222), (62, 50, 39), (252, 252, 252), (239, 235, 222),
+        (239, 235, 222), (62, 50, 39), (62, 50, 39), (220, 210, 197),
+        (62, 50, 39), (193, 154, 107), (255, 255, 255),
+    ),
+    "Ocean dark": (
+        (38, 50, 56), (255, 255, 255), (69, 90, 100), (55, 71, 79),
+        (38, 50, 56), (255, 255, 255), (255, 255, 255), (55, 71, 79),
+        (255, 255, 255), (0, 137, 123), (0, 0, 0),
+    ),
+    "Ocean light": (
+        (225, 238, 245), (0, 0, 0), (240, 248, 252), (230, 240, 247),
+        (215, 230, 240), (0, 0, 0), (0, 0, 0), (213, 234, 242), (0, 0, 0),
+        (0, 123, 167), (255, 255, 255),
+    ),
+    "Contrast": (
+        (0, 0, 0), (255, 255, 255), (0, 0, 0), (55, 55, 55), (0, 0, 0),
+        (255, 255, 255), (255, 255, 255), (0, 0, 0), (255, 255, 255),
+        (255, 0, 0), (255, 255, 255),
+    ),
+    "Contrast White": (
+        (255, 255, 255), (0, 0, 0), (255, 255, 255), (200, 200, 200),
+        (255, 255, 255), (0, 0, 0), (0, 0, 0), (255, 255, 255), (0, 0, 0),
+        (0, 0, 0), (255, 255, 255),
+    ),
+    "Moon": (
+        (0, 43, 54), (253, 246, 227), (7, 54, 66), (0, 43, 54), (7, 54, 66),
+        (253, 246, 227), (253, 246, 227), (7, 54, 66), (253, 246, 227),
+        (38, 139, 210), (0, 0, 0),
+    ),
+    "Solar": (
+        (253, 246, 227), (101, 123, 131), (255, 250, 240), (253, 246, 227),
+        (238, 232, 213), (88, 110, 117), (88, 110, 117), (238, 232, 213),
+        (88, 110, 117), (38, 139, 210), (255, 255, 255),
+    ),
+    "Cyber": (
+        (10, 10, 20), (0, 255, 255), (30, 30, 45), (25, 25, 35), (45, 45, 65),
+        (255, 0, 255), (0, 255, 255), (40, 40, 55), (255, 0, 255),
+        (255, 0, 128), (255, 255, 255),
+    ),
+    "Dracula": (
+        "#282a36", "#f8f8f2", "#1e1f29", "#282a36", "#44475a", "#f8f8f2",
+        "#f8f8f2", "#44475a", "#f8f8f2", "#bd93f9", (0, 0, 0),
+    ),
+    "Nord": (
+        "#2e3440", "#d8dee9", "#3b4252", "#434c5e", "#4c566a", "#eceff4",
+        "#e5e9f0", "#4c566a", "#d8dee9", "#88c0d0", (0, 0, 0),
+    ),
+    "Gruvbox": (
+        "#282828", "#ebdbb2", "#32302f", "#3c3836", "#504945", "#fbf1c7",
+        "#ebdbb2", "#504945", "#ebdbb2", "#d79921", (0, 0, 0),
+    ),
+    "Monokai": (
+        "#272822", "#f8f8f2", "#1e1f1c", "#272822", "#3e3d32", "#f8f8f2",
+        "#f8f8f2", "#3e3d32", "#f8f8f2", "#a6e22e", (0, 0, 0),
+    ),
+    "Tokyo": (
+        "#1a1b26", "#c0caf5", "#1f2335", "#24283b", "#414868", "#c0caf5",
+        "#c0caf5", "#414868", "#c0caf5", "#7aa2f7", (255, 255, 255),
+    ),
+    "Mocha": (
+        "#1e1e2e", "#cdd6f4", "#181825", "#1e1e2e", "#313244", "#cdd6f4",
+        "#cdd6f4", "#313244", "#cdd6f4", "#f38ba8", (0, 0, 0),
+    ),
+    "Palenight": (
+        "#292d3e", "#a6accd", "#1b1d2b", "#222436", "#444267", "#a6accd",
+        "#a6accd", "#444267", "#a6accd", "#82aaff", (0, 0, 0),
+    ),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def theme_palette(name: str) -> QtGui.QPalette:
+    """Build the QPalette for theme *name* (once; later calls share it)."""
+    palette = QtGui.QPalette()
+    for role, color in zip(_PALETTE_ROLES, _THEME_SPECS[name]):
+        palette.setColor(role, QtGui.QColor(color) if isinstance(color, str) else QtGui.QColor(*color))
+    return palette
+
+
+class ThemeRegistry(Mapping):
+    """Read-only theme name -> QPalette mapping; palettes are built on lookup."""
+
+    def __getitem__(self, name: str) -> QtGui.QPalette:
+        return theme_palette(name)
+
+    def __iter__(self):
+        return iter(_THEME_SPECS)
+
+    def __len__(self) -> int:
+        return len(_THEME_SPECS)
+
+
+def build_theme_dict() -> Mapping:
+    """Return a mapping of theme names to QPalettes.
+
+    Only the names exist up front: a palette is built the first time its
+    theme is looked up, so startup constructs just the theme in use.
+    """
+    return ThemeRegistry()
 
 
 # ------------------------------- Centered tabs -------------------------------
@@ -405,6 +309,173 @@ class CenteredTabWidget(QtWidgets.QWidget):
         self.currentChanged.emit(i)
 
 
+# ------------------------------- History buffers -------------------------------
+
+class HistoryBuffer:
+    """
+    Fixed-length history for one or more series, kept as a NumPy ring buffer.
+    Every sample is written twice (at i and i + length), so the chronological
+    window of a row is always the contiguous slice [i, i + length): plots get
+    a float64 view directly, with no list()/np.roll copy per frame.
+    """
+    def __init__(self, length: int, rows: int = 1):
+        self.length = max(1, int(length))
+        self.rows = max(1, int(rows))
+        self._buf = np.zeros((self.rows, 2 * self.length), dtype=np.float64)
+        self._i = 0
+
+    def push(self, values, count: int = 1) -> None:
+        """Append one sample per row (a scalar when there is a single row),
+        ``count`` times in a row."""
+        for _ in range(count):
+            i = self._i
+            self._buf[:, i] = values
+            self._buf[:, i + self.length] = values
+            self._i = (i + 1) % self.length
+
+    def reset(self, length: int) -> "HistoryBuffer":
+        """Zero the history for reuse, or return a new buffer if ``length`` changed."""
+        if max(1, int(length)) != self.length:
+            return HistoryBuffer(length, self.rows)
+        self._buf.fill(0.0)
+        self._i = 0
+        return self
+
+    def view(self, row: int = 0) -> np.ndarray:
+        """Oldest→newest samples of ``row`` (a view, valid until the next push)."""
+        return self._buf[row, self._i:self._i + self.length]
+
+    def last(self, row: int = 0) -> float:
+        return float(self._buf[row, self._i + self.length - 1])
+
+    def max(self) -> float:
+        return float(self._buf[:, :self.length].max())
+
+    def flat_rows(self, eps: float) -> np.ndarray:
+        """Boolean mask of rows whose whole window spans less than ``eps``."""
+        return np.ptp(self._buf[:, :self.length], axis=1) < eps
+
+
+# ------------------------------- Multi-series curve -------------------------------
+
+class MultiCurveItem(pg.GraphicsObject):
+    """
+    Many same-length series drawn by one graphics item, each with its own pen
+    and optional fill down to zero.  A frame costs one scene update instead
+    of one PlotDataItem pipeline per series; paths are rebuilt only for the
+    rows handed to ``set_rows``.  Long histories are reduced to a min/max
+    envelope per pixel column, like pyqtgraph's "peak" downsampling, and wide
+    opaque aliased pens are drawn as line segments, as PlotCurveItem does,
+    since Qt strokes a wide polyline path far more slowly.
+    """
+    def __init__(self, pens: List[QtGui.QPen], y_max: float = 100.0):
+        super().__init__()
+        n = len(pens)
+        self._pens = list(pens)
+        self._brushes: List[Optional[QtGui.QBrush]] = [None] * n
+        self._paths = [QtGui.QPainterPath() for _ in range(n)]
+        self._data: List[Optional[tuple]] = [None] * n
+        self._segments: list = [None] * n
+        self._fills: List[Optional[QtGui.QPainterPath]] = [None] * n
+        self._rect = QtCore.QRectF(0.0, 0.0, 1.0, y_max)
+        self._y_max = y_max
+        self._antialias = bool(pg.getConfigOption("antialias"))
+
+    def set_pen(self, row: int, pen: QtGui.QPen) -> None:
+        self._pens[row] = pen
+        self.update()
+
+    def set_brush(self, row: int, brush) -> None:
+        """Fill under ``row`` with ``brush`` (None disables the fill)."""
+        self._brushes[row] = None if brush is None else QtGui.QBrush(brush)
+        self._fills[row] = None if brush is None else self._fill_path(self._paths[row])
+        self.update()
+
+    def set_antialias(self, on: bool) -> None:
+        if bool(on) != self._antialias:
+            self._antialias = bool(on)
+            self.update()
+
+    def set_rows(self, x: np.ndarray, rows, ys) -> None:
+        """Replace the data of ``rows`` (indices) with the arrays in ``ys``."""
+        if len(x) and (x[0] != self._rect.left() or x[-1] != self._rect.right()):
+            self.prepareGeometryChange()
+            self._rect = QtCore.QRectF(float(x[0]), 0.0, float(x[-1] - x[0]), self._y_max)
+        ds = self._downsample_factor(len(x))
+        for row, y in zip(rows, ys):
+            if ds > 1:
+                xd, yd = self._peak(x, y, ds)
+            else:
+                xd, yd = x, y
+            path = pg.arrayToQPath(xd, yd, connect="all", finiteCheck=False)
+            self._paths[row] = path
+            self._data[row] = (xd, yd)
+            self._segments[row] = None
+            if self._brushes[row] is not None:
+                self._fills[row] = self._fill_path(path)
+        self.update()
+
+    def _downsample_factor(self, n: int) -> int:
+        vb = self.getViewBox()
+        px = int(vb.width()) if vb is not None else 0
+        return n // px if px > 0 else 1
+
+    @staticmethod
+    def _peak(x: np.ndarray, y: np.ndarray, ds: int):
+        n = len(y) // ds
+        blocks = y[:n * ds].reshape(n, ds)
+        tail = y[n * ds:]
+        m = n + (1 if len(tail) else 0)
+        yd = np.empty(2 * m)
+        yd[0:2 * n:2] = blocks.min(axis=1)
+        yd[1:2 * n:2] = blocks.max(axis=1)
+        xd = np.repeat(x[::ds][:m], 2)
+        if len(tail):
+            # Partial last block: keep the newest samples on screen
+            yd[-2] = tail.min()
+            yd[-1] = tail.max()
+            xd[-1] = x[-1]
+        return xd, yd
+
+    def _fill_path(self, path: QtGui.QPainterPath) -> QtGui.QPainterPath:
+        fill = QtGui.QPainterPath(path)
+        if not path.isEmpty():
+            fill.lineTo(path.currentPosition().x(), 0.0)
+            fill.lineTo(path.elementAt(0).x, 0.0)
+            fill.closeSubpath()
+        return fill
+
+    def boundingRect(self) -> QtCore.QRectF:
+        return self._rect
+
+    def _use_segments(self, pen: QtGui.QPen) -> bool:
+        return (
+            arrayToLineSegments is not None
+            and not self._antialias
+            and pen.widthF() > 1.0
+            and pen.style() == QtCore.Qt.SolidLine
+            and pen.isSolid()
+            and pen.color().alphaF() == 1.0
+        )
+
+    def paint(self, p, *args):
+        p.setRenderHint(QtGui.QPainter.Antialiasing, self._antialias)
+        for row, (pen, brush, path, fill) in enumerate(
+            zip(self._pens, self._brushes, self._paths, self._fills)
+        ):
+            if brush is not None and fill is not None:
+                p.fillPath(fill, brush)
+            p.setPen(pen)
+            if self._data[row] is not None and self._use_segments(pen):
+                if self._segments[row] is None:
+                    self._segments[row] = arrayToLineSegments(
+                        *self._data[row], connect="all", finiteCheck=False
+                    )
+                p.drawLines(*self._segments[row].drawargs())
+            else:
+                p.drawPath(path)
+
+
 # ------------------------------- Axes (Ubuntu-like) -------------------------------
 
 class TimeAxisItem(pg.AxisItem):
@@ -416,13 +487,21 @@ class TimeAxisItem(pg.AxisItem):
         super().__init__(orientation='bottom', *args, **kwargs)
         self.history_len = max(1, int(history_len))
         self.interval_seconds = max(1e-6, float(interval_seconds))
+        # Tick positions only move when the range changes (mouse is disabled),
+        # so the formatted labels are memoized per set of tick values.
+        self._label_cache: Dict[tuple, List[str]] = {}
 
     def update_params(self, history_len: int, interval_seconds: float):
         self.history_len = max(1, int(history_len))
         self.interval_seconds = max(1e-6, float(interval_seconds))
+        self._label_cache.clear()
         self.picture = None  # force re-render
 
     def tickStrings(self, values, scale, spacing):
+        key = tuple(values)
+        cached = self._label_cache.get(key)
+        if cached is not None:
+            return cached
         labels = []
         total_secs = (self.history_len - 1) * self.interval_seconds
         for x in values:
@@ -433,6 +512,9 @@ class TimeAxisItem(pg.AxisItem):
             else:
                 secs = int(round(remaining))
                 labels.append(f"{secs} secs")
+        if len(self._label_cache) >= 8:
+            self._label_cache.clear()
+        self._label_cache[key] = labels
         return labels
 
 class PercentAxisItem(pg.AxisItem):
@@ -447,8 +529,30 @@ class PercentAxisItem(pg.AxisItem):
 # ------------------------------- Clickable swatch -------------------------------
 
 class ClickableLabel(QtWidgets.QLabel):
-    """Small color swatch that emits a clicked() signal."""
+    """Small color swatch that emits a clicked() signal.
+
+    The swatch paints its own rounded rectangle: a per-widget style sheet
+    would make Qt parse CSS for every swatch and re-polish all of them on
+    each theme change.
+    """
     clicked = QtCore.pyqtSignal()
+    RADIUS = 2.0
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._color = QtGui.QColor()
+
+    def set_color(self, color: QtGui.QColor) -> None:
+        if color != self._color:
+            self._color = QtGui.QColor(color)
+            self.update()
+
+    def paintEvent(self, e: QtGui.QPaintEvent):
+        p = QtGui.QPainter(self)
+        p.setRenderHint(QtGui.QPainter.Antialiasing)
+        p.setPen(QtCore.Qt.NoPen)
+        p.setBrush(self._color)
+        p.drawRoundedRect(QtCore.QRectF(self.rect()), self.RADIUS, self.RADIUS)
 
     def mousePressEvent(self, e: QtGui.QMouseEvent):
         if e.button() == QtCore.Qt.LeftButton:
@@ -469,6 +573,7 @@ class LegendGrid(QtWidgets.QWidget):
     def __init__(self, labels: List[str], colors: List[QtGui.QColor], on_color_change, columns=4, parent=None):
         super().__init__(parent)
         self.value_labels: List[QtWidgets.QLabel] = []
+        self._last_texts: List[str] = []  # mirrors value_labels to skip no-op setText
         self.swatches: List[ClickableLabel] = []
         self.on_color_change = on_color_change
 
@@ -478,13 +583,17 @@ class LegendGrid(QtWidgets.QWidget):
         self.grid.setVerticalSpacing(2)
 
         self.columns = max(1, min(4, int(columns)))  # hard cap at 4
+        self._rows: List[QtWidgets.QWidget] = []
 
-        for idx, (text, col) in enumerate(zip(labels, colors)):
-            r, c = divmod(idx, self.columns)
+        self._build_rows(labels, colors)
+        self._layout_rows(self.columns)
 
+    def _build_rows(self, labels: List[str], colors: List[QtGui.QColor]):
+        """Create one row widget per CPU; done once, reflowed by _layout_rows."""
+        for idx, (text, col) in enumerate(zip(labels, colors)):
             swatch = ClickableLabel()
             swatch.setFixedSize(20, 12)
-            swatch.setStyleSheet(f"background:{col.name()}; border-radius:2px;")
+            swatch.set_color(col)
             swatch.clicked.connect(lambda i=idx: self._pick_color(i))
             self.swatches.append(swatch)
 
@@ -492,6 +601,7 @@ class LegendGrid(QtWidgets.QWidget):
 
             val = QtWidgets.QLabel("0.0% · —")
             self.value_labels.append(val)
+            self._last_texts.append(val.text())
 
             roww = QtWidgets.QWidget()
             roww.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
@@ -501,25 +611,54 @@ class LegendGrid(QtWidgets.QWidget):
             rowl.addWidget(name)
             rowl.addWidget(val)
             rowl.addStretch(1)
+            self._rows.append(roww)
+
+    def _layout_rows(self, columns: int):
+        """Place the existing row widgets on a grid *columns* wide."""
+        used = min(columns, len(self._rows))
+        for c in range(max(self.grid.columnCount(), used)):
+            self.grid.setColumnStretch(c, 1 if c < used else 0)
+        for idx, roww in enumerate(self._rows):
+            r, c = divmod(idx, columns)
+            self.grid.removeWidget(roww)
             self.grid.addWidget(roww, r, c)
-            self.grid.setColumnStretch(c, 1)
+
+    def set_columns(self, columns: int):
+        """Reflow the legend into *columns* columns (1–4) without rebuilding it."""
+        columns = max(1, min(4, int(columns)))
+        if columns != self.columns:
+            self.columns = columns
+            self._layout_rows(columns)
 
     def _pick_color(self, i: int):
         """Open QColorDialog and notify the parent when a color is chosen."""
         col = QtWidgets.QColorDialog.getColor(parent=self)
         if col.isValid():
-            self.swatches[i].setStyleSheet(f"background:{col.name()}; border-radius:2px;")
+            self.swatches[i].set_color(col)
             if callable(self.on_color_change):
                 self.on_color_change(i, col)
 
     def set_values(self, usages: List[float], freqs_mhz: Optional[List[float]] = None):
         """Update the per-CPU legend values."""
-        for i, lab in enumerate(self.value_labels):
-            pct = usages[i] if i < len(usages) else 0.0
-            if freqs_mhz and i < len(freqs_mhz) and freqs_mhz[i] and freqs_mhz[i] > 0:
-                lab.setText(f"{pct:,.1f}% · {human_freq(freqs_mhz[i])}")
-            else:
-                lab.setText(f"{pct:,.1f}% ")
+        n = len(self.value_labels)
+        pcts = list(usages[:n]) + [0.0] * (n - len(usages))
+        mhz = list(freqs_mhz[:n]) if freqs_mhz else []
+        mhz += [None] * (n - len(mhz))
+        # Percentages never reach four digits, so no grouping is needed; the
+        # frequency is formatted inline (same output as human_freq)
+        texts = [
+            (
+                "%.1f%% · %.2f GHz" % (pct, f / 1000.0) if f >= 1000.0
+                else "%.1f%% · %.0f MHz" % (pct, f)
+            ) if f and f > 0 else "%.1f%% " % pct
+            for pct, f in zip(pcts, mhz)
+        ]
+        # Only touch labels whose text changed: steady readings cause no repaint
+        last = self._last_texts
+        for i, text in enumerate(texts):
+            if text != last[i]:
+                last[i] = text
+                self.value_labels[i].setText(text)
 
 
 # ------------------------------- Collapsible section -------------------------------
@@ -530,6 +669,7 @@ class CollapsibleSection(QtWidgets.QWidget):
     def __init__(self, title: str, parent=None):
         super().__init__(parent)
         self.toggle = QtWidgets.QToolButton(text=title, checkable=True, checked=True)
+        self._last_fg: Optional[str] = None
         # Style the toggle so that its text color follows the current palette
         self._update_toggle_style()
         # Apply an initial bold font to the toggle so section titles stand out.
@@ -557,10 +697,36 @@ class CollapsibleSection(QtWidgets.QWidget):
             QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding
         )
         self.default_stretch = 1
+        # (parent layout, our index in it), resolved once instead of per toggle
+        self._cached_layout_index: Optional[Tuple[QtWidgets.QLayout, int]] = None
+
+    def bind_parent_layout(self, layout: QtWidgets.QLayout, index: int) -> None:
+        """Tell the section where it sits in its parent's layout."""
+        self._cached_layout_index = (layout, index)
+
+    def _parent_layout_index(self) -> Optional[Tuple[QtWidgets.QLayout, int]]:
+        cached = self._cached_layout_index
+        if cached is not None:
+            layout, idx = cached
+            item = layout.itemAt(idx)
+            if item is not None and item.widget() is self:
+                return cached
+        parent = self.parentWidget()
+        layout = parent.layout() if parent is not None else None
+        if layout is None:
+            return None
+        idx = layout.indexOf(self)
+        if idx == -1:
+            return None
+        self._cached_layout_index = (layout, idx)
+        return self._cached_layout_index
 
     def _update_toggle_style(self):
         """Ensure the section title respects the palette's text color."""
         fg = self.palette().color(QtGui.QPalette.WindowText).name()
+        if fg == self._last_fg:
+            return  # same color: skip the style sheet re-parse
+        self._last_fg = fg
         self.toggle.setStyleSheet(
             f"QToolButton {{ border: none; color: {fg}; }}"
         )
@@ -588,19 +754,47 @@ class CollapsibleSection(QtWidgets.QWidget):
             QtWidgets.QSizePolicy.Expanding,
             QtWidgets.QSizePolicy.Expanding if visible else QtWidgets.QSizePolicy.Fixed,
         )
-        parent = self.parentWidget()
-        if parent is not None:
-            layout = parent.layout()
-            if layout is not None:
-                idx = layout.indexOf(self)
-                if idx != -1:
-                    layout.setStretch(idx, self.default_stretch if visible else 0)
+        found = self._parent_layout_index()
+        if found is not None:
+            layout, idx = found
+            layout.setStretch(idx, self.default_stretch if visible else 0)
 
     def add_widget(self, w: QtWidgets.QWidget):
         self.content_layout.addWidget(w)
 
 # ------------------------------- Resources tab -------------------------------
 
+class ResourceSampler(QtCore.QObject):
+    """
+    Worker living in its own QThread that reads the per-tick metrics
+    (per-CPU usage, memory/swap, network counters).  psutil's /proc reads
+    can stall under heavy I/O; here that delays a sample, not the GUI.
+    Snapshots reach the GUI thread through a queued signal.
+    """
+    sampled = QtCore.pyqtSignal(object)
+
+    def __init__(self, n_cpu: int, parent=None):
+        super().__init__(parent)
+        self.n_cpu = n_cpu
+        self.prev_net = network.io_counters()
+        self.prev_t = time.monotonic()
+
+    @QtCore.pyqtSlot()
+    def sample(self):
+        raw = np.zeros(self.n_cpu)
+        try:
+            cpu.percent_into(raw)
+        except Exception:
+            pass
+        vm, sm = memory.stats()
+        rx_kib, tx_kib, self.prev_net, self.prev_t = network.rates(self.prev_net, self.prev_t)
+        self.sampled.emit({
+            "cpu": raw,
+            "mem": (vm, sm),
+            "net": (rx_kib, tx_kib, self.prev_net),
+        })
+
+
 class ResourcesTab(QtWidgets.QWidget):
     """
     Ubuntu-style resources page:
@@ -610,11 +804,16 @@ class ResourcesTab(QtWidgets.QWidget):
       • Network RX/TX plot with autoscaling.
     Performance:
       - Separate timers: plots (graphs) vs text (legend & labels).
+      - Plot-tick sampling runs in a worker thread (ResourceSampler).
       - Optional per-CPU frequencies to save syscalls when disabled.
     """
     # Defaults (can be changed live from Preferences)
     HISTORY_SECONDS   = 60
     PLOT_UPDATE_MS    = 150    # graphs cadence
+    # While the tab is hidden or the window minimized, sample this many times
+    # less often; each sample fills that many history slots so the time axis
+    # stays right when the plots are shown again.
+    BACKGROUND_SLOWDOWN = 10
     TEXT_UPDATE_MS    = 1000    # legend/labels cadence
     EMA_ALPHA         = 0.60   # base EMA alpha
     MEM_EMA_ALPHA     = 0.90
@@ -628,6 +827,7 @@ class ResourcesTab(QtWidgets.QWidget):
     SHOW_GRID_Y       = True
     GRID_DIVS         = 10
     ANTIALIAS         = True
+    USE_OPENGL        = False  # render the main plots through an OpenGL viewport
     FILL_CPU          = False  # optionally fill area under CPU lines
     SMOOTH_NET_GRAPH  = True   # independent network smoothing toggle
     CPU_FILL_ALPHA    = 80     # alpha value for CPU area fills (0-255)
@@ -640,13 +840,48 @@ class ResourcesTab(QtWidgets.QWidget):
     CPU_MULTI_LABEL_COLOR = "#ffffff"  # color for per-CPU labels
     CPU_MULTI_LABEL_MATCH = False      # label text follows curve color
     CPU_GENERAL_COLOR = ""            # empty means use first CPU color
+    # A CPU curve whose whole window is flat within this many percent (and
+    # still at the level it was last drawn at) is not re-sent to pyqtgraph;
+    # every CPU_FORCE_REDRAW frames all curves are redrawn regardless.
+    CPU_REDRAW_EPS    = 0.3
+    CPU_FORCE_REDRAW  = 20
+    # Same idea for the memory (percent) and network (KiB/s) curves
+    MEM_REDRAW_EPS    = 0.1
+    NET_REDRAW_EPS    = 0.1
+    # Auto-downsampling (used by every plot curve) keeps the min/max of every
+    # bin ("peak", the M4-style envelope) so short spikes survive when the
+    # history outgrows the plot width; "mean" would flatten them.
+    CPU_DOWNSAMPLE_METHOD = "peak"
+    # Antialiasing dominates paint time with many overlapping thread lines:
+    # above this many CPUs the per-thread curves are drawn aliased, with
+    # flat caps and bevel joins, whatever the ANTIALIAS setting.
+    CPU_AA_MAX_CPUS   = 8
+    # The network Y range (peak + 20% headroom) is only re-fitted once the
+    # peak grows past NET_RANGE_GROW or falls below NET_RANGE_SHRINK times
+    # the fitted peak, so steady traffic leaves the axis and ticks alone.
+    NET_RANGE_GROW    = 1.1
+    NET_RANGE_SHRINK  = 0.66
 
     # CPU view modes
     CPU_VIEW_MODES = ["Multi thread", "General view", "Multi window"]
     CPU_VIEW_MODE   = "Multi thread"  # default
 
+    # Memory/network label templates, filled by the text timer from the
+    # numbers the plot timer last stored
+    MEM_LABEL_TPL = "Memory %s (%.1f%%) of %s — %s   |   %s"
+    SWAP_LABEL_TPL = "Swap %.1f%% of %s"
+    NET_LABEL_TPL = (
+        "<span style='color:#64b4ff'>Receiving %s KiB/s</span> — Total %s     "
+        "<span style='color:#ff7864'>Sending %s KiB/s</span> — Total %s"
+    )
+
+    # Emitted (queued) to ask the sampler thread for a new snapshot
+    _request_sample = QtCore.pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # plot -> inputs its tick spacing was last computed from
+        self._tick_keys: Dict[pg.PlotWidget, tuple] = {}
 
         # Global plot settings
         pg.setConfigOptions(antialias=self.ANTIALIAS)
@@ -677,27 +912,27 @@ class ResourcesTab(QtWidgets.QWidget):
         self.cpu_plot.installEventFilter(self)
 
         # Colors & pens (HSV palette to start, user can override via legend)
-        self.cpu_colors: List[QtGui.QColor] = []
-        self.cpu_curves, self.cpu_histories = [], []
-        self.cpu_plot_ema1 = [0.0] * self.n_cpu   # for double EMA (extra smoothing)
-        self.cpu_plot_ema2 = [0.0] * self.n_cpu
-        for i in range(self.n_cpu):
-            hue = i / max(1, self.n_cpu)
-            color = QtGui.QColor.fromHsvF(hue, 0.75, 0.95, 1.0)
-            self.cpu_colors.append(color)
+        self.cpu_history = HistoryBuffer(history_len, self.n_cpu)
+        # Shared x positions / zero line reused by every curve (never rebuilt per tick)
+        self._x_vals = np.arange(history_len, dtype=np.float64)
+        self._zeros = np.zeros(history_len, dtype=np.float64)
+        self.cpu_plot_ema1 = np.zeros(self.n_cpu)   # for double EMA (extra smoothing)
+        self.cpu_plot_ema2 = np.zeros(self.n_cpu)
+        self.cpu_plot_vals = np.zeros(self.n_cpu)   # smoothed values pushed per tick
+        self._reset_cpu_redraw_state()
+        self.cpu_colors: List[QtGui.QColor] = [
+            QtGui.QColor.fromRgbF(r, g, b) for r, g, b in hue_wheel(self.n_cpu, 0.75, 0.95).tolist()
+        ]
         # Default mono-color uses the first generated color
         self.cpu_mono_color = QtGui.QColor(self.cpu_colors[0])
-        for i in range(self.n_cpu):
-            history = deque([0.0] * history_len, maxlen=history_len)
-            self.cpu_histories.append(history)
-            pen = pg.mkPen(color=self.cpu_colors[i], width=self.THREAD_LINE_WIDTH)
-            curve = self.cpu_plot.plot([0] * history_len, pen=pen, name=f"CPU{i+1}")
-            try:
-                curve.setClipToView(True)
-                curve.setDownsampling(auto=True, method='mean')
-            except Exception:
-                pass
-            self.cpu_curves.append(curve)
+        # One pen per CPU, shared by the multi-thread and mini-plot curves and
+        # only rebuilt when that CPU's color or the line width changes
+        self.cpu_pens = [self._thread_pen(c) for c in self.cpu_colors]
+        self._cpu_pen_width = self.THREAD_LINE_WIDTH
+        # All per-thread lines of the multi-thread view share one item
+        self.cpu_lines = MultiCurveItem(self.cpu_pens)
+        self.cpu_plot.addItem(self.cpu_lines)
+        self.cpu_lines.set_rows(self._x_vals, range(self.n_cpu), [self._zeros] * self.n_cpu)
 
         legend_labels = [f"CPU{i+1}" for i in range(self.n_cpu)]
         # Legend in a scroll area (max 4 columns; grows downward)
@@ -737,16 +972,12 @@ class ResourcesTab(QtWidgets.QWidget):
             QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding
         )
         self.cpu_general_plot.installEventFilter(self)
-        self.cpu_general_history = deque([0.0] * history_len, maxlen=history_len)
+        self.cpu_general_history = HistoryBuffer(history_len)
         # Independent color for the average usage line (general view)
         self.cpu_general_color = QtGui.QColor(self.cpu_colors[0])
         pen = pg.mkPen(color=self.cpu_general_color, width=self.THREAD_LINE_WIDTH)
-        self.cpu_general_curve = self.cpu_general_plot.plot([0] * history_len, pen=pen)
-        try:
-            self.cpu_general_curve.setClipToView(True)
-            self.cpu_general_curve.setDownsampling(auto=True, method="mean")
-        except Exception:
-            pass
+        self.cpu_general_curve = self.cpu_general_plot.plot(self._x_vals, self._zeros, pen=pen)
+        self._downsample(self.cpu_general_curve)
 
         # Multi window: one plot per CPU core in a scrollable grid
         self.cpu_mini_plots: List[pg.PlotWidget] = []
@@ -780,14 +1011,13 @@ class ResourcesTab(QtWidgets.QWidget):
             )
             plot.setMinimumSize(self.CPU_MINI_MIN_W, self.CPU_MINI_MIN_H)
             plot.installEventFilter(self)
-            color = self.cpu_mono_color if self.CPU_MULTI_MONO else self.cpu_colors[i]
-            pen = pg.mkPen(color=color, width=self.THREAD_LINE_WIDTH)
-            curve = plot.plot([0] * history_len, pen=pen)
-            try:
-                curve.setClipToView(True)
-                curve.setDownsampling(auto=True, method="mean")
-            except Exception:
-                pass
+            pen = (
+                self._thread_pen(self.cpu_mono_color)
+                if self.CPU_MULTI_MONO
+                else self.cpu_pens[i]
+            )
+            curve = plot.plot(self._x_vals, self._zeros, pen=pen)
+            self._downsample(curve)
             label = pg.TextItem("", color=self.cpu_label_color, anchor=(0.5, 0))
             label.setPos((history_len - 1) / 2, 100)
             plot.addItem(label)
@@ -838,24 +1068,30 @@ class ResourcesTab(QtWidgets.QWidget):
         )
         self.mem_plot.installEventFilter(self)
 
-        self._x_vals = list(range(history_len))
-        self._zeros = [0] * history_len
-        self.mem_hist = deque([0.0] * history_len, maxlen=history_len)
-        self.swap_hist = deque([0.0] * history_len, maxlen=history_len)
-
-        self.mem_base = pg.PlotCurveItem(self._x_vals, self._zeros, pen=None)
-        self.mem_curve = pg.PlotCurveItem(pen=pg.mkPen(width=2))
-        self.mem_fill = pg.FillBetweenItem(self.mem_curve, self.mem_base, brush=(60, 130, 200, 80))
-        self.mem_plot.addItem(self.mem_base)
-        self.mem_plot.addItem(self.mem_curve)
-        self.mem_plot.addItem(self.mem_fill)
-
-        self.swap_base = pg.PlotCurveItem(self._x_vals, self._zeros, pen=None)
-        self.swap_curve = pg.PlotCurveItem(pen=pg.mkPen((200, 120, 60), width=2, style=QtCore.Qt.DashLine))
-        self.swap_fill = pg.FillBetweenItem(self.swap_curve, self.swap_base, brush=(200, 120, 60, 60))
-        self.mem_plot.addItem(self.swap_base)
-        self.mem_plot.addItem(self.swap_curve)
-        self.mem_plot.addItem(self.swap_fill)
+        self.mem_hist = HistoryBuffer(history_len)
+        self.swap_hist = HistoryBuffer(history_len)
+
+        # The baseline is always zero, so each curve fills down to fillLevel=0
+        # itself rather than pairing with a zero curve in a FillBetweenItem.
+        self.mem_curve = self.mem_plot.plot(
+            self._x_vals, self._zeros,
+            pen=pg.mkPen(width=2), fillLevel=0, brush=(60, 130, 200, 80),
+        )
+        self.swap_curve = self.mem_plot.plot(
+            self._x_vals, self._zeros,
+            pen=pg.mkPen((200, 120, 60), width=2, style=QtCore.Qt.DashLine),
+            fillLevel=0,
+            brush=(200, 120, 60, 60),
+        )
+        self._downsample(self.mem_curve)
+        self._downsample(self.swap_curve)
+
+        # True while the swap history is flat zero (no swap / unused): the swap
+        # curve already shows that line and is left untouched.
+        self._swap_idle = False
+        # Curve name -> level it was last drawn flat at (see _set_curve)
+        self._flat_drawn: Dict[str, float] = {}
+        self._net_ymax = 0.0
 
         self.mem_label = QtWidgets.QLabel("Memory —")
 
@@ -872,16 +1108,26 @@ class ResourcesTab(QtWidgets.QWidget):
         )
         self.net_plot.installEventFilter(self)
 
-        self.rx_hist = deque([0.0] * history_len, maxlen=history_len)
-        self.tx_hist = deque([0.0] * history_len, maxlen=history_len)
+        self.rx_hist = HistoryBuffer(history_len)
+        self.tx_hist = HistoryBuffer(history_len)
         self.rx_curve = self.net_plot.plot(self._x_vals, self._zeros, pen=pg.mkPen((100, 180, 255), width=2))
         self.tx_curve = self.net_plot.plot(self._x_vals, self._zeros, pen=pg.mkPen((255, 120, 100), width=2))
+        self._downsample(self.rx_curve)
+        self._downsample(self.tx_curve)
         self.net_ema_rx = 0.0
         self.net_ema_tx = 0.0
         self.net_label = QtWidgets.QLabel("<span style='color:#64b4ff'>Receiving —</span>  <span style='color:#ff7864'>Sending —</span>")
         self.net_label.setTextFormat(QtCore.Qt.RichText)
 
-        # Text placeholders updated by the text timer
+        # History buffers only ever hold finite values, so pyqtgraph's
+        # per-frame isfinite() scan of every curve can be skipped
+        for curve in self._plot_curves():
+            curve.setSkipFiniteCheck(True)
+        self._apply_antialias()
+
+        # Text placeholders updated by the text timer from the latest samples
+        self._mem_sample = None
+        self._net_sample = None
         self._mem_label_text = "Memory —"
         self._net_label_text = "<span style='color:#64b4ff'>Receiving —</span>  <span style='color:#ff7864'>Sending —</span>"
 
@@ -902,50 +1148,124 @@ class ResourcesTab(QtWidgets.QWidget):
         self.net_section.add_widget(self.net_label)
         self.net_section.default_stretch = 1
 
-        layout.addWidget(self.cpu_section, 2)
-        layout.addWidget(self.mem_section, 1)
-        layout.addWidget(self.net_section, 1)
+        for section, stretch in (
+            (self.cpu_section, 2), (self.mem_section, 1), (self.net_section, 1)
+        ):
+            layout.addWidget(section, stretch)
+            section.bind_parent_layout(layout, layout.count() - 1)
 
         # ----- Initial state & timers -----
-        self.prev_net = network.io_counters()
-        self.prev_t = time.monotonic()
-
-        self.cpu_last_raw = [0.0] * self.n_cpu
-        self.cpu_display_ema1 = [0.0] * self.n_cpu  # legend smoothing (double-EMA)
-        self.cpu_display_ema2 = [0.0] * self.n_cpu
-
-        # Cache and worker thread for temperature queries so UI timer isn't blocked
-        self._temp_cache: Optional[float] = None
-        self._temp_thread: Optional[threading.Thread] = None
+        # Raw per-CPU usage is sampled at plot cadence; the legend shows the
+        # mean of the samples accumulated since the previous text tick
+        self.cpu_last_raw = np.zeros(self.n_cpu)
+        self.cpu_raw_sum = np.zeros(self.n_cpu)
+        self.cpu_raw_count = 0
+        self.cpu_display_ema1 = np.zeros(self.n_cpu)  # legend smoothing (double-EMA)
+        self.cpu_display_ema2 = np.zeros(self.n_cpu)
+        self.cpu_display_vals = np.zeros(self.n_cpu)
 
         cpu.percent(percpu=True)  # warm-up to set baselines
 
+        # Plot-tick metrics are read off the GUI thread; at most one request
+        # is in flight so a stalled read never queues up behind the timer.
+        self._sampling = False
+        self._sampler_thread = QtCore.QThread(self)
+        self._sampler = ResourceSampler(self.n_cpu)
+        self._sampler.moveToThread(self._sampler_thread)
+        self._request_sample.connect(self._sampler.sample)
+        self._sampler.sampled.connect(self._apply_sample)
+        self._sampler_thread.finished.connect(self._sampler.deleteLater)
+        self._sampler_thread.start()
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_sampler)
+
         # Separate timers: plot vs stats (started when visible)
         self.plot_timer = QtCore.QTimer(self)
+        # Qt schedules repeating timers from their previous deadline, so the
+        # cadence does not drift; a precise timer also keeps the default
+        # coarse one's ±5% slack out of the per-sample spacing that the
+        # history's time axis and the EMAs assume.
+        self.plot_timer.setTimerType(QtCore.Qt.PreciseTimer)
         self.plot_timer.timeout.connect(self._update_plots)
+        self._push_repeat = 1  # history slots filled per sample
 
+        # When TEXT_UPDATE_MS is (close to) a multiple of PLOT_UPDATE_MS the
+        # labels ride on every Nth plot sample instead of a second timer
         self.text_timer = QtCore.QTimer(self)
         self.text_timer.timeout.connect(self._update_text)
+        self._labels_on = False
+        self._text_divisor = 0  # N, or 0 while text_timer drives the labels
+        self._text_tick = 0
 
         self._apply_freq_visibility()
         if self.SHOW_CPU_TEMP and self.cpu_temp_label is not None:
-            self._schedule_temperature()
+            cpu.temperature()  # start the background sampler
         self._update_tick_steps()
 
         # Ensure custom text elements start with the correct application font.
         self.update_fonts(self.font())
 
+    def _stop_sampler(self):
+        """Stop the sampler thread (called when the application quits)."""
+        if self._sampler_thread.isRunning():
+            self._sampler_thread.quit()
+            self._sampler_thread.wait()
+
     def showEvent(self, e: QtGui.QShowEvent):
-        self.plot_timer.start(self.PLOT_UPDATE_MS)
-        self.text_timer.start(self.TEXT_UPDATE_MS)
+        super().showEvent(e)
+        self._resume_drawing()
+
+    def set_minimized(self, minimized: bool) -> None:
+        """Pause the labels while the window is minimized; catch up on restore."""
+        if minimized:
+            self._stop_labels()
+            self._set_background(True)
+        elif self.isVisible():
+            self._resume_drawing()
+
+    def _set_background(self, background: bool) -> None:
+        """Switch plot sampling between full and background (slowed) cadence."""
+        self._push_repeat = self.BACKGROUND_SLOWDOWN if background else 1
+        self.plot_timer.setInterval(self.PLOT_UPDATE_MS * self._push_repeat)
+
+    def _resume_drawing(self):
+        # Curves were not touched while hidden: redraw everything once
+        self._reset_cpu_redraw_state()
+        self._swap_idle = False
+        self._flat_drawn.clear()
+        self._net_ymax = 0.0
+        self._set_background(False)
+        self.plot_timer.start()
+        self._start_labels()
         self._update_plots()
         self._update_text()
-        super().showEvent(e)
 
     def hideEvent(self, e: QtGui.QHideEvent):
-        # Keep timers running even when the tab is hidden so plots remain up-to-date
+        # The plot timer keeps sampling into the history buffers, at the
+        # background cadence, so the graphs have no gap when the tab is shown
+        # again; the drawing (and the label timer) is skipped while hidden.
+        self._stop_labels()
+        self._set_background(True)
         super().hideEvent(e)
 
+    def _start_labels(self):
+        """Refresh the labels every TEXT_UPDATE_MS, piggybacking on the plot
+        samples when the two cadences line up."""
+        ratio = self.TEXT_UPDATE_MS / self.PLOT_UPDATE_MS
+        n = round(ratio)
+        self._text_divisor = n if n >= 1 and abs(ratio - n) <= 0.05 * n else 0
+        self._text_tick = 0
+        self._labels_on = True
+        if self._text_divisor:
+            self.text_timer.stop()
+        else:
+            self.text_timer.start(self.TEXT_UPDATE_MS)
+
+    def _stop_labels(self):
+        self._labels_on = False
+        self.text_timer.stop()
+
     def eventFilter(self, obj, event):
         plots = [self.cpu_plot, self.cpu_general_plot] + self.cpu_mini_plots
         if hasattr(self, "mem_plot"):
@@ -988,15 +1308,13 @@ class ResourcesTab(QtWidgets.QWidget):
 
     def _apply_cpu_fill(self):
         """Enable or disable translucent area under CPU curves for all view modes."""
-        for i, curve in enumerate(self.cpu_curves):
+        for i, color in enumerate(self.cpu_colors):
             if self.FILL_CPU:
-                c = QtGui.QColor(self.cpu_colors[i])
+                c = QtGui.QColor(color)
                 c.setAlpha(self.CPU_FILL_ALPHA)
-                curve.setBrush(c)
-                curve.setFillLevel(0)
+                self.cpu_lines.set_brush(i, c)
             else:
-                curve.setBrush(None)
-                curve.setFillLevel(None)
+                self.cpu_lines.set_brush(i, None)
 
         # Average usage line (general view)
         # Always update the pen so color changes affect the curve itself
@@ -1026,10 +1344,13 @@ class ResourcesTab(QtWidgets.QWidget):
 
     def _apply_multi_colors(self):
         """Update mini-plot pens according to mono-color settings."""
+        mono_pen = (
+            self._thread_pen(self.cpu_mono_color)
+            if self.CPU_MULTI_MONO
+            else None
+        )
         for i, curve in enumerate(self.cpu_mini_curves):
-            color = self.cpu_mono_color if self.CPU_MULTI_MONO else self.cpu_colors[i]
-            pen = pg.mkPen(color=color, width=self.THREAD_LINE_WIDTH)
-            curve.setPen(pen)
+            curve.setPen(mono_pen if mono_pen is not None else self.cpu_pens[i])
         if self.CPU_MULTI_LABEL_MATCH:
             self._apply_label_color()
 
@@ -1107,10 +1428,23 @@ class ResourcesTab(QtWidgets.QWidget):
                 nice = 10.0
             return nice * (10 ** exp)
 
+        cpu_plots = [self.cpu_plot, self.mem_plot, self.cpu_general_plot] + self.cpu_mini_plots
+
         for p in plots:
             width = max(1, int(p.size().width()))
             height = max(1, int(p.size().height()))
 
+            # The steps depend only on these inputs: skip plots whose ticks
+            # were already set for them
+            is_pct = p in cpu_plots
+            key = (
+                width, height, hist_len, self.PLOT_UPDATE_MS, self.GRID_DIVS,
+                None if is_pct else tuple(p.viewRange()[1]),
+            )
+            if self._tick_keys.get(p) == key:
+                continue
+            self._tick_keys[p] = key
+
             # ---------------- X axis (time) ----------------
             # Target how many labels fit across the width.
             target_lbls_x = max(MIN_LABELS_X, min(self.GRID_DIVS + 1, width // PX_PER_LABEL_X))
@@ -1123,8 +1457,7 @@ class ResourcesTab(QtWidgets.QWidget):
             p.getAxis('bottom').setTickSpacing(step_x, step_x)
 
             # ---------------- Y axis (values) ----------------
-            cpu_plots = [self.cpu_plot, self.mem_plot, self.cpu_general_plot] + self.cpu_mini_plots
-            if p in cpu_plots:
+            if is_pct:
                 # Lock Y to 0..100 so CPU/Mem always show percentages consistently.
                 p.setYRange(0, 100)
 
@@ -1159,29 +1492,45 @@ class ResourcesTab(QtWidgets.QWidget):
 
     def _on_color_change(self, cpu_index: int, color: QtGui.QColor):
         """Legend callback: update curve color across all views."""
-        if 0 <= cpu_index < len(self.cpu_curves):
+        if 0 <= cpu_index < self.n_cpu:
             old_color = self.cpu_colors[cpu_index]
             self.cpu_colors[cpu_index] = color
-            pen = pg.mkPen(color=color, width=self.THREAD_LINE_WIDTH)
-            self.cpu_curves[cpu_index].setPen(pen)
+            # Only this CPU's pen (and fill) is recolored; every other curve
+            # keeps its pen and brush untouched.  The pen object is kept, so
+            # its width, caps and joins need no rebuilding.
+            pen = self.cpu_pens[cpu_index]
+            pen.setColor(color)
+            self.cpu_lines.set_pen(cpu_index, pen)
+            fill = None
+            if self.FILL_CPU:
+                fill = QtGui.QColor(color)
+                fill.setAlpha(self.CPU_FILL_ALPHA)
+                self.cpu_lines.set_brush(cpu_index, fill)
             if cpu_index == 0 and self.cpu_general_color == old_color:
                 self.cpu_general_color = QtGui.QColor(color)
                 self.cpu_general_curve.setPen(
                     pg.mkPen(color=self.cpu_general_color, width=self.THREAD_LINE_WIDTH)
                 )
+                if fill is not None:
+                    self.cpu_general_curve.setBrush(fill)
             if not self.CPU_MULTI_MONO and cpu_index < len(self.cpu_mini_curves):
                 self.cpu_mini_curves[cpu_index].setPen(pen)
-            else:
-                self._apply_multi_colors()
-            if self.FILL_CPU:
-                self._apply_cpu_fill()
-            if self.CPU_MULTI_LABEL_MATCH:
-                self._apply_label_color()
+                if fill is not None:
+                    self.cpu_mini_curves[cpu_index].setBrush(fill)
+                if self.CPU_MULTI_LABEL_MATCH:
+                    self._apply_label_color()
+
+    def _reset_cpu_redraw_state(self):
+        """Forget what was last drawn so every CPU curve is redrawn next tick."""
+        self._cpu_frame = 0
+        self._cpu_drawn_flat = np.zeros(self.n_cpu, dtype=bool)
+        self._cpu_drawn_level = np.zeros(self.n_cpu)
 
     def set_cpu_view_mode(self, mode: str):
         if mode not in self.CPU_VIEW_MODES:
             mode = self.CPU_VIEW_MODE
         self.cpu_view_mode = mode
+        self._reset_cpu_redraw_state()
         lay = self.cpu_section.content_layout
         while lay.count():
             item = lay.takeAt(0)
@@ -1222,21 +1571,71 @@ class ResourcesTab(QtWidgets.QWidget):
             self._apply_label_mode()
         self.cpu_section.default_stretch = 2
 
-    def _apply_freq_visibility(self):
-        self.cpu_freq_avg_label.setVisible(self.SHOW_CPU_FREQ)
+    def _apply_opengl(self):
+        """Switch the main plots between OpenGL and raster viewports.
+
+        Mini plots stay on the raster path: one GL context per core would
+        cost more than it saves.  Failure (no GL driver, remote session)
+        falls back to raster rendering.
+        """
+        for plot in (self.cpu_plot, self.cpu_general_plot, self.mem_plot, self.net_plot):
+            try:
+                plot.useOpenGL(self.USE_OPENGL)
+            except Exception:
+                self.USE_OPENGL = False
+                try:
+                    plot.useOpenGL(False)
+                except Exception:
+                    pass
 
-    def _temperature_worker(self):
-        """Background worker to fetch CPU temperature without stalling UI."""
-        self._temp_cache = cpu.temperature()
-        self._temp_thread = None
+    def _downsample(self, curve: pg.PlotDataItem) -> None:
+        """Draw at most ~2 points per pixel column of *curve*'s plot.
 
-    def _schedule_temperature(self):
-        """Spawn a worker thread to refresh CPU temperature."""
-        if self._temp_thread is None or not self._temp_thread.is_alive():
-            self._temp_thread = threading.Thread(
-                target=self._temperature_worker, daemon=True
-            )
-            self._temp_thread.start()
+        Auto mode re-derives the factor from the view width on every resize,
+        so long histories cost O(width) to paint rather than O(history).
+        """
+        curve.setClipToView(True)
+        curve.setDownsampling(auto=True, method=self.CPU_DOWNSAMPLE_METHOD)
+
+    def _thread_pen(self, color) -> QtGui.QPen:
+        """Pen for a per-thread CPU curve (cheap to stroke on many-core hosts)."""
+        if self.n_cpu <= self.CPU_AA_MAX_CPUS:
+            return pg.mkPen(color=color, width=self.THREAD_LINE_WIDTH)
+        # Fractional widths make Qt rasterize every segment as a polygon;
+        # whole-pixel widths stay on the fast line-drawing path
+        pen = pg.mkPen(color=color, width=max(1, round(self.THREAD_LINE_WIDTH)))
+        pen.setCapStyle(QtCore.Qt.FlatCap)
+        pen.setJoinStyle(QtCore.Qt.BevelJoin)
+        return pen
+
+    def _plot_curves(self) -> list:
+        return [
+            *self.cpu_mini_curves, self.cpu_general_curve,
+            self.mem_curve, self.swap_curve, self.rx_curve, self.tx_curve,
+        ]
+
+    def _apply_antialias(self):
+        """Push ANTIALIAS to the existing curves.
+
+        pyqtgraph only reads the global option when an item is created, so
+        toggling it later has to reach every curve explicitly.
+        """
+        pg.setConfigOptions(antialias=self.ANTIALIAS)
+        threads_aa = self.ANTIALIAS and self.n_cpu <= self.CPU_AA_MAX_CPUS
+        self.cpu_lines.set_antialias(threads_aa)
+        per_thread = len(self.cpu_mini_curves)
+        for i, curve in enumerate(self._plot_curves()):
+            aa = threads_aa if i < per_thread else self.ANTIALIAS
+            if curve.opts.get("antialias") == aa:
+                continue
+            curve.opts["antialias"] = aa
+            if isinstance(curve, pg.PlotDataItem):
+                curve.updateItems()
+            else:
+                curve.update()
+
+    def _apply_freq_visibility(self):
+        self.cpu_freq_avg_label.setVisible(self.SHOW_CPU_FREQ)
 
     # ---------- public API (Preferences) ----------
     def apply_settings(
@@ -1269,6 +1668,7 @@ class ResourcesTab(QtWidgets.QWidget):
         label_pos: str,
         label_match: bool,
         label_color: str,
+        use_opengl: bool = False,
     ):
         """Rebuild buffers/axes and timers according to Preferences."""
         self.HISTORY_SECONDS   = int(max(5, history_seconds))
@@ -1285,7 +1685,10 @@ class ResourcesTab(QtWidgets.QWidget):
         self.SMOOTH_GRAPHS     = bool(smooth_graphs)
         self.EXTRA_SMOOTHING   = bool(extra_smoothing)
         self.ANTIALIAS         = bool(antialias)
-        pg.setConfigOptions(antialias=self.ANTIALIAS)
+        self._apply_antialias()
+        if bool(use_opengl) != self.USE_OPENGL:
+            self.USE_OPENGL = bool(use_opengl)
+            self._apply_opengl()
         self.FILL_CPU          = bool(fill_cpu)
         self.SMOOTH_NET_GRAPH  = bool(smooth_net_graph)
         self.NET_EMA_ALPHA     = float(min(0.999, max(0.0, net_ema_alpha)))
@@ -1308,15 +1711,15 @@ class ResourcesTab(QtWidgets.QWidget):
 
         # Update timers only if currently active
         was_plot = self.plot_timer.isActive()
-        was_text = self.text_timer.isActive()
+        was_text = self._labels_on
         if was_plot:
             self.plot_timer.stop()
         if was_text:
-            self.text_timer.stop()
+            self._stop_labels()
         if was_plot:
-            self.plot_timer.start(self.PLOT_UPDATE_MS)
+            self.plot_timer.start(self.PLOT_UPDATE_MS * self._push_repeat)
         if was_text:
-            self.text_timer.start(self.TEXT_UPDATE_MS)
+            self._start_labels()
 
         # Axes / ranges / grids
         history_len = self._history_len()
@@ -1337,47 +1740,100 @@ class ResourcesTab(QtWidgets.QWidget):
         self.cpu_multi_container.setMinimumSize(0, 0)
 
         # Rebuild buffers for graphs
-        self.cpu_histories = [deque([0.0] * history_len, maxlen=history_len) for _ in range(self.n_cpu)]
-        for i, curve in enumerate(self.cpu_curves):
-            pen = pg.mkPen(color=self.cpu_colors[i], width=self.THREAD_LINE_WIDTH)
-            curve.setPen(pen)
-            curve.setData([0.0] * history_len)
+        # The shared x/zero arrays are only rebuilt when the length changes
+        if len(self._x_vals) != history_len:
+            self._x_vals = np.arange(history_len, dtype=np.float64)
+            self._zeros = np.zeros(history_len, dtype=np.float64)
+        self.cpu_history = self.cpu_history.reset(history_len)
+        self._reset_cpu_redraw_state()
+        self._flat_drawn.clear()
+        if self.THREAD_LINE_WIDTH != self._cpu_pen_width:
+            self.cpu_pens = [self._thread_pen(c) for c in self.cpu_colors]
+            self._cpu_pen_width = self.THREAD_LINE_WIDTH
+            for i, pen in enumerate(self.cpu_pens):
+                self.cpu_lines.set_pen(i, pen)
+        self.cpu_lines.set_rows(self._x_vals, range(self.n_cpu), [self._zeros] * self.n_cpu)
         for curve in self.cpu_mini_curves:
-            curve.setData([0.0] * history_len)
+            curve.setData(self._x_vals, self._zeros)
         self._apply_multi_colors()
         self._apply_label_color()
         self._apply_label_mode()
         self._apply_cpu_fill()
-        self.cpu_general_history = deque([0.0] * history_len, maxlen=history_len)
-        self.cpu_general_curve.setData([0.0] * history_len)
-        self.cpu_plot_ema1 = [0.0] * self.n_cpu
-        self.cpu_plot_ema2 = [0.0] * self.n_cpu
-        self.cpu_display_ema1 = [0.0] * self.n_cpu
-        self.cpu_display_ema2 = [0.0] * self.n_cpu
+        self.cpu_general_history = self.cpu_general_history.reset(history_len)
+        self.cpu_general_curve.setData(self._x_vals, self._zeros)
+        self.cpu_plot_ema1.fill(0.0)
+        self.cpu_plot_ema2.fill(0.0)
+        self.cpu_display_ema1.fill(0.0)
+        self.cpu_display_ema2.fill(0.0)
 
         # Reposition mini labels for the new history length
         if self.CPU_MULTI_LABEL_INSIDE:
             for lbl in self.cpu_mini_labels:
                 lbl.setPos((history_len - 1) / 2, 100)
 
-        self._x_vals = list(range(history_len))
-        self._zeros = [0] * history_len
-        self.mem_hist = deque([0.0] * history_len, maxlen=history_len)
-        self.swap_hist = deque([0.0] * history_len, maxlen=history_len)
-        self.mem_base.setData(self._x_vals, self._zeros)
-        self.swap_base.setData(self._x_vals, self._zeros)
-        self.rx_hist = deque([0.0] * history_len, maxlen=history_len)
-        self.tx_hist = deque([0.0] * history_len, maxlen=history_len)
+        self.mem_hist = self.mem_hist.reset(history_len)
+        self.swap_hist = self.swap_hist.reset(history_len)
+        self.swap_curve.setData(self._x_vals, self._zeros)
+        self.rx_hist = self.rx_hist.reset(history_len)
+        self.tx_hist = self.tx_hist.reset(history_len)
         self.rx_curve.setData(self._x_vals, self._zeros)
         self.tx_curve.setData(self._x_vals, self._zeros)
         self.net_ema_rx = 0.0
         self.net_ema_tx = 0.0
+        self._net_ymax = 0.0
 
         # Frequencies visibility
         self._apply_freq_visibility()
         if self.SHOW_CPU_TEMP and self.cpu_temp_label is not None:
-            self._schedule_temperature()
-        
+            cpu.temperature()  # start the background sampler
+
+    # Settings apply_partial() can change in place; anything else needs the
+    # full apply_settings() rebuild (buffers, axes, pens).
+    PARTIAL_SETTINGS = frozenset({
+        "text_update_ms", "ema_alpha", "mem_ema_alpha", "net_ema_alpha",
+        "show_grid_x", "show_grid_y", "antialias", "use_opengl", "fill_cpu",
+        "smooth_net_graph", "multi_cols",
+    })
+
+    def apply_partial(self, changes: Dict[str, object]) -> bool:
+        """Apply a subset of apply_settings() keywords without a rebuild.
+
+        Returns False (and changes nothing) when *changes* holds a setting
+        outside PARTIAL_SETTINGS; the caller then uses apply_settings().
+        """
+        if not changes.keys() <= self.PARTIAL_SETTINGS:
+            return False
+        if "text_update_ms" in changes:
+            self.TEXT_UPDATE_MS = int(max(50, changes["text_update_ms"]))
+            if self._labels_on:
+                self._start_labels()
+        if "ema_alpha" in changes:
+            self.EMA_ALPHA = float(min(0.999, max(0.0, changes["ema_alpha"])))
+        if "mem_ema_alpha" in changes:
+            self.MEM_EMA_ALPHA = float(min(0.999, max(0.0, changes["mem_ema_alpha"])))
+        if "net_ema_alpha" in changes:
+            self.NET_EMA_ALPHA = float(min(0.999, max(0.0, changes["net_ema_alpha"])))
+        if "smooth_net_graph" in changes:
+            self.SMOOTH_NET_GRAPH = bool(changes["smooth_net_graph"])
+        if "show_grid_x" in changes or "show_grid_y" in changes:
+            self.SHOW_GRID_X = bool(changes.get("show_grid_x", self.SHOW_GRID_X))
+            self.SHOW_GRID_Y = bool(changes.get("show_grid_y", self.SHOW_GRID_Y))
+            for plot in [self.cpu_plot, self.mem_plot, self.net_plot, self.cpu_general_plot] + self.cpu_mini_plots:
+                self._apply_grid(plot)
+        if "antialias" in changes:
+            self.ANTIALIAS = bool(changes["antialias"])
+            self._apply_antialias()
+        if "use_opengl" in changes and bool(changes["use_opengl"]) != self.USE_OPENGL:
+            self.USE_OPENGL = bool(changes["use_opengl"])
+            self._apply_opengl()
+        if "fill_cpu" in changes:
+            self.FILL_CPU = bool(changes["fill_cpu"])
+            self._apply_cpu_fill()
+        if "multi_cols" in changes:
+            self.CPU_MULTI_COLS = int(max(1, changes["multi_cols"]))
+            self._regrid_mini_plots()
+        return True
+
     def apply_theme(self, palette: QtGui.QPalette):
         """Update plot colors to match the given palette."""
         bg = palette.color(QtGui.QPalette.Window)
@@ -1405,33 +1861,29 @@ class ResourcesTab(QtWidgets.QWidget):
 
     # ---------- TEXT TIMER (legend & labels) ----------
     def _update_text(self):
-        # Per-CPU usage (store raw, then double-EMA for stable legend)
-        per = cpu.percent(percpu=True)
-        n = min(len(per), self.n_cpu)
-        usages = []
-        for i in range(n):
-            raw = max(0.0, float(per[i]))
-            self.cpu_last_raw[i] = raw
-            if self.SMOOTH_GRAPHS:
-                a_cpu = self.EMA_ALPHA
-                self.cpu_display_ema1[i] = a_cpu * self.cpu_display_ema1[i] + (1.0 - a_cpu) * raw
-                self.cpu_display_ema2[i] = a_cpu * self.cpu_display_ema2[i] + (1.0 - a_cpu) * self.cpu_display_ema1[i]
-                smoothed = (
-                    2 * self.cpu_display_ema1[i] - self.cpu_display_ema2[i]
-                    if self.EXTRA_SMOOTHING
-                    else self.cpu_display_ema1[i]
-                )
-                usages.append(max(0.0, smoothed))
-            else:
-                self.cpu_display_ema1[i] = raw
-                self.cpu_display_ema2[i] = raw
-                usages.append(raw)
+        # Per-CPU usage is sampled by the plot timer; the legend uses the mean
+        # of the raw samples since the last text tick, double-EMA'd for
+        # stability.  The remaining CPU metrics come from one acquisition call.
+        snap = cpu.sample(self.n_cpu, with_percent=False, with_freqs=self.SHOW_CPU_FREQ)
+        if self.cpu_raw_count:
+            window_raw = self.cpu_raw_sum / self.cpu_raw_count
+            self.cpu_raw_sum.fill(0.0)
+            self.cpu_raw_count = 0
+        else:
+            window_raw = self.cpu_last_raw
+        double_ema(
+            window_raw,
+            self.cpu_display_ema1,
+            self.cpu_display_ema2,
+            self.EMA_ALPHA if self.SMOOTH_GRAPHS else 0.0,
+            self.EXTRA_SMOOTHING,
+            self.cpu_display_vals,
+        )
+        usages = self.cpu_display_vals.tolist()
 
         # Optional per-CPU frequency + average
-        per_freq_mhz: Optional[List[float]] = None
-        avg_freq = None
-        if self.SHOW_CPU_FREQ:
-            per_freq_mhz, avg_freq = cpu.freqs(self.n_cpu)
+        per_freq_mhz: Optional[List[float]]
+        per_freq_mhz, avg_freq = snap["freqs"]
 
         if self.cpu_view_mode == "Multi thread":
             self.cpu_legend_grid.set_values(usages, per_freq_mhz)
@@ -1456,9 +1908,8 @@ class ResourcesTab(QtWidgets.QWidget):
             )
 
         if self.SHOW_CPU_TEMP and self.cpu_temp_label is not None:
-            # Non-blocking temperature update using cached value
-            self._schedule_temperature()
-            temp_c = self._temp_cache
+            # Non-blocking: returns the sampler's latest reading
+            temp_c = cpu.temperature()
             if temp_c is not None:
                 self.cpu_temp_label.setText(f"CPU Temperature: {temp_c:.1f}°C")
             else:
@@ -1468,69 +1919,57 @@ class ResourcesTab(QtWidgets.QWidget):
         self.cpu_total_label.setText(f"Total CPU Usage: {total_usage:.1f}%")
 
         # Update cached labels for memory and network
+        self._update_sample_labels()
         self.mem_label.setText(self._mem_label_text)
         self.net_label.setText(self._net_label_text)
     # ---------- PLOT TIMER (graphs only) ----------
     def _update_plots(self):
-        # CPU: optional smoothing toward the latest raw usage values
-        a_cpu = self.EMA_ALPHA
-        avg_vals: List[float] = []
-        for i in range(self.n_cpu):
-            if self.SMOOTH_GRAPHS:
-                self.cpu_plot_ema1[i] = a_cpu * self.cpu_plot_ema1[i] + (1.0 - a_cpu) * self.cpu_last_raw[i]
-                if self.EXTRA_SMOOTHING:
-                    self.cpu_plot_ema2[i] = a_cpu * self.cpu_plot_ema2[i] + (1.0 - a_cpu) * self.cpu_plot_ema1[i]
-                    use_val = 2 * self.cpu_plot_ema1[i] - self.cpu_plot_ema2[i]
-                else:
-                    use_val = self.cpu_plot_ema1[i]
-            else:
-                self.cpu_plot_ema1[i] = self.cpu_last_raw[i]
-                self.cpu_plot_ema2[i] = self.cpu_last_raw[i]
-                use_val = self.cpu_last_raw[i]
-            use_val = max(0.0, use_val)
-            self.cpu_histories[i].append(use_val)
-            avg_vals.append(use_val)
-            if self.cpu_view_mode == "Multi thread":
-                self.cpu_curves[i].setData(list(self.cpu_histories[i]))
-            elif self.cpu_view_mode == "Multi window":
-                self.cpu_mini_curves[i].setData(list(self.cpu_histories[i]))
+        """Ask the sampler for this tick's metrics; _apply_sample draws them."""
+        if not self._sampling:
+            self._sampling = True
+            self._request_sample.emit()
+
+    @QtCore.pyqtSlot(object)
+    def _apply_sample(self, snap):
+        self._sampling = False
+        # Fresh per-CPU usage every plot tick (also accumulated for the legend)
+        self.cpu_last_raw = snap["cpu"]
+        self.cpu_raw_sum += self.cpu_last_raw
+        self.cpu_raw_count += 1
+
+        # CPU: optional smoothing toward the latest raw usage values,
+        # advanced for all CPUs in a single vectorised call
+        double_ema(
+            self.cpu_last_raw,
+            self.cpu_plot_ema1,
+            self.cpu_plot_ema2,
+            self.EMA_ALPHA if self.SMOOTH_GRAPHS else 0.0,
+            self.EXTRA_SMOOTHING,
+            self.cpu_plot_vals,
+        )
 
-        if self.cpu_view_mode == "General view":
-            avg = sum(avg_vals) / len(avg_vals) if avg_vals else 0.0
-            self.cpu_general_history.append(avg)
-            self.cpu_general_curve.setData(list(self.cpu_general_history))
+        # One column per tick (repeated while in the background) into the
+        # ring; curves receive views of it
+        k = self._push_repeat
+        self.cpu_history.push(self.cpu_plot_vals, k)
+        self.cpu_general_history.push(self.cpu_plot_vals.mean(), k)
 
         # Memory / Swap (EMA)
-        vm, sm = memory.stats()
+        vm, sm = snap["mem"]
         mem_val = vm.percent
         swap_val = sm.percent if sm and sm.total > 0 else 0.0
         if self.SMOOTH_GRAPHS:
-            mem_ema = self.MEM_EMA_ALPHA * (self.mem_hist[-1] if self.mem_hist else 0.0) + (1.0 - self.MEM_EMA_ALPHA) * mem_val
-            swap_ema = self.MEM_EMA_ALPHA * (self.swap_hist[-1] if self.swap_hist else 0.0) + (1.0 - self.MEM_EMA_ALPHA) * swap_val
+            mem_ema = self.MEM_EMA_ALPHA * self.mem_hist.last() + (1.0 - self.MEM_EMA_ALPHA) * mem_val
+            swap_ema = self.MEM_EMA_ALPHA * self.swap_hist.last() + (1.0 - self.MEM_EMA_ALPHA) * swap_val
         else:
             mem_ema = mem_val
             swap_ema = swap_val
-
-        self.mem_hist.append(mem_ema)
-        self.swap_hist.append(swap_ema)
-        self.mem_curve.setData(self._x_vals, list(self.mem_hist))
-        self.mem_base.setData(self._x_vals, self._zeros)
-        self.swap_curve.setData(self._x_vals, list(self.swap_hist))
-        self.swap_base.setData(self._x_vals, self._zeros)
-
-        cache_txt = f"Cache {human_bytes(getattr(vm, 'cached', 0))}" if getattr(vm, 'cached', 0) else "Cache —"
-        swap_txt = (
-            "Swap not available"
-            if not sm or sm.total == 0
-            else f"Swap {swap_ema:.1f}% of {human_bytes(sm.total)}"
-        )
-        self._mem_label_text = (
-            f"Memory {human_bytes(vm.used)} ({mem_ema:.1f}%) of {human_bytes(vm.total)} — {cache_txt}   |   {swap_txt}"
-        )
+        self.mem_hist.push(mem_ema, k)
+        self.swap_hist.push(swap_ema, k)
+        self._mem_sample = (vm, sm, mem_ema, swap_ema)
 
         # Network rates
-        rx_kib, tx_kib, self.prev_net, self.prev_t = network.rates(self.prev_net, self.prev_t)
-        cur = self.prev_net
+        rx_kib, tx_kib, net_totals = snap["net"]
 
         if self.SMOOTH_NET_GRAPH:
             na = self.NET_EMA_ALPHA
@@ -1543,37 +1982,395 @@ class ResourcesTab(QtWidgets.QWidget):
             self.net_ema_tx = tx_kib
             rx_use = rx_kib
             tx_use = tx_kib
+        self.rx_hist.push(rx_use, k)
+        self.tx_hist.push(tx_use, k)
+        self._net_sample = (rx_use, tx_use, net_totals)
+
+        # Sampling above always runs; drawing is skipped while the tab is
+        # hidden or the window is minimized
+        if self.isVisible() and not self.window().isMinimized():
+            self._render_plots(swap_ema)
+        if self._labels_on and self._text_divisor:
+            self._text_tick += 1
+            if self._text_tick >= self._text_divisor:
+                self._text_tick = 0
+                self._update_text()
+
+    def _render_plots(self, swap_ema: float):
+        """Hand the current history windows to the visible curves."""
+        if self.cpu_view_mode in ("Multi thread", "Multi window"):
+            # Idle cores draw a flat line: while the window stays flat at the
+            # drawn level, scrolling it changes nothing visible, so skip it.
+            eps = self.CPU_REDRAW_EPS
+            level = self.cpu_plot_vals
+            flat = self.cpu_history.flat_rows(eps)
+            self._cpu_frame += 1
+            if self._cpu_frame % self.CPU_FORCE_REDRAW:
+                skip = flat & self._cpu_drawn_flat & (np.abs(level - self._cpu_drawn_level) < eps)
+            else:
+                skip = np.zeros(self.n_cpu, dtype=bool)
+            rows = np.flatnonzero(~skip)
+            if self.cpu_view_mode == "Multi thread":
+                self.cpu_lines.set_rows(self._x_vals, rows, [self.cpu_history.view(i) for i in rows])
+            else:
+                for i in rows:
+                    self.cpu_mini_curves[i].setData(self._x_vals, self.cpu_history.view(i))
+            self._cpu_drawn_flat = np.where(skip, self._cpu_drawn_flat, flat)
+            self._cpu_drawn_level = np.where(skip, self._cpu_drawn_level, level)
+        elif self.cpu_view_mode == "General view":
+            self.cpu_general_curve.setData(self._x_vals, self.cpu_general_history.view())
+
+        self._set_curve("mem", self.mem_curve, self.mem_hist, self.MEM_REDRAW_EPS)
+        swap_idle = swap_ema == 0.0 and self.swap_hist.max() == 0.0
+        if not (swap_idle and self._swap_idle):
+            self.swap_curve.setData(self._x_vals, self.swap_hist.view())
+        self._swap_idle = swap_idle
+
+        self._set_curve("rx", self.rx_curve, self.rx_hist, self.NET_REDRAW_EPS)
+        self._set_curve("tx", self.tx_curve, self.tx_hist, self.NET_REDRAW_EPS)
+        max_y = max(1.0, self.rx_hist.max(), self.tx_hist.max())
+        # Hysteresis band: drifts inside it keep the current axis and ticks
+        if not (
+            self.NET_RANGE_SHRINK * self._net_ymax <= max_y <= self.NET_RANGE_GROW * self._net_ymax
+        ):
+            self._net_ymax = max_y
+            self.net_plot.setYRange(0, max_y * 1.2)
+            self._update_tick_steps(self.net_plot)
+
+    def _set_curve(self, name: str, curve: pg.PlotDataItem, hist: HistoryBuffer, eps: float):
+        """Hand *hist* to *curve*, unless the whole window is still flat (within
+        *eps*) at the level last drawn: scrolling it would change nothing."""
+        level = hist.last()
+        flat = bool(hist.flat_rows(eps)[0])
+        drawn = self._flat_drawn.get(name)
+        if flat and drawn is not None and abs(level - drawn) < eps:
+            return
+        curve.setData(self._x_vals, hist.view())
+        if flat:
+            self._flat_drawn[name] = level
+        else:
+            self._flat_drawn.pop(name, None)
+
+    def _update_sample_labels(self):
+        """Format the memory/network label texts from the latest plot sample."""
+        if self._mem_sample is not None:
+            vm, sm, mem_ema, swap_ema = self._mem_sample
+            cached = getattr(vm, 'cached', 0)
+            cache_txt = "Cache " + human_bytes(cached) if cached else "Cache —"
+            swap_txt = (
+                "Swap not available"
+                if not sm or sm.total == 0
+                else self.SWAP_LABEL_TPL % (swap_ema, human_bytes(sm.total))
+            )
+            self._mem_label_text = self.MEM_LABEL_TPL % (
+                human_bytes(vm.used), mem_ema, human_bytes(vm.total), cache_txt, swap_txt
+            )
+        if self._net_sample is not None:
+            rx_use, tx_use, cur = self._net_sample
+            self._net_label_text = self.NET_LABEL_TPL % (
+                format(rx_use, ",.1f"), human_bytes(cur.bytes_recv),
+                format(tx_use, ",.1f"), human_bytes(cur.bytes_sent),
+            )
+
 
-        self.rx_hist.append(rx_use)
-        self.tx_hist.append(tx_use)
-        self.rx_curve.setData(self._x_vals, list(self.rx_hist))
-        self.tx_curve.setData(self._x_vals, list(self.tx_hist))
-
-        max_y = max(1.0, max(max(self.rx_hist), max(self.tx_hist)))
-        self.net_plot.setYRange(0, max_y * 1.2)
-        self._update_tick_steps(self.net_plot)
-        self._net_label_text = (
-            f"<span style='color:#64b4ff'>Receiving {rx_use:,.1f} KiB/s</span> — Total {human_bytes(cur.bytes_recv)}     "
-            f"<span style='color:#ff7864'>Sending {tx_use:,.1f} KiB/s</span> — Total {human_bytes(cur.bytes_sent)}"
+# ------------------------------- Table models -------------------------------
+
+class KeyedTableModel(QtCore.QAbstractTableModel):
+    """
+    Table model whose rows are identified by a key (PID, mount point, disk).
+    Every cell is a (text, sort value, tooltip) tuple: the text is displayed,
+    the sort value is exposed as Qt.UserRole for the sort proxy and the
+    tooltip falls back to the text.  update() diffs a new snapshot against the
+    current rows, so views only repaint what actually changed and no per-cell
+    QObjects are ever created.
+    A cell may leave its text (and tooltip) as None when its column has an
+    entry in ``formats`` (``tip_formats``): the string is then built from the
+    sort value only when a view asks for it, i.e. for visible cells.
+    """
+    # Above this fraction of removed rows update() resets the model instead
+    RESET_FRACTION = 0.25
+
+    def __init__(self, headers: List[str], parent=None):
+        super().__init__(parent)
+        self.headers = list(headers)
+        self._keys: list = []
+        self._rows: List[list] = []
+        self._row_for_key: Dict[object, int] = {}
+        self.formats: Dict[int, object] = {}
+        self.tip_formats: Dict[int, object] = {}
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+        text, sortv, tip = self._rows[index.row()][col]
+        if role == QtCore.Qt.DisplayRole:
+            return self.formats[col](sortv) if text is None else text
+        if role == QtCore.Qt.UserRole:
+            return text if sortv is None else sortv
+        if role == QtCore.Qt.ToolTipRole:
+            if tip:
+                return tip
+            fmt = self.tip_formats.get(col)
+            if fmt is not None:
+                return fmt(sortv)
+            return self.formats[col](sortv) if text is None else text
+        return None
+
+    def headerData(self, section: int, orientation, role: int = QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def key_at(self, row: int):
+        return self._keys[row]
+
+    def row_of(self, key) -> Optional[int]:
+        return self._row_for_key.get(key)
+
+    def text_at(self, row: int, col: int) -> str:
+        text, sortv, _tip = self._rows[row][col]
+        return self.formats[col](sortv) if text is None else text
+
+    def update(self, rows: Dict[object, list]) -> None:
+        """Make the model hold exactly *rows* (key -> list of cells)."""
+        root = QtCore.QModelIndex()
+
+        gone = [r for r, key in enumerate(self._keys) if key not in rows]
+        if gone and len(gone) > self.RESET_FRACTION * len(self._keys):
+            # Heavy churn: one model reset is cheaper than many row shifts
+            self.beginResetModel()
+            self._keys = [key for key in self._keys if key in rows]
+            self._keys += [key for key in rows if key not in self._row_for_key]
+            self._rows = [rows[key] for key in self._keys]
+            self._row_for_key = {key: r for r, key in enumerate(self._keys)}
+            self.endResetModel()
+            return
+
+        # Rows whose key disappeared, removed as contiguous runs (last run
+        # first so earlier indices stay valid)
+        runs: List[List[int]] = []
+        for r in gone:
+            if runs and runs[-1][1] == r - 1:
+                runs[-1][1] = r
+            else:
+                runs.append([r, r])
+        row_for_key = self._row_for_key
+        for first, last in reversed(runs):
+            self.beginRemoveRows(root, first, last)
+            for key in self._keys[first:last + 1]:
+                del row_for_key[key]
+            del self._keys[first:last + 1]
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+        if gone:
+            # Only rows below the first removal moved up
+            keys = self._keys
+            for r in range(gone[0], len(keys)):
+                row_for_key[keys[r]] = r
+
+        # Surviving rows: a single dataChanged spanning the changed cells
+        top = left = None
+        bottom = right = -1
+        for r, key in enumerate(self._keys):
+            new = rows[key]
+            old = self._rows[r]
+            if new is old or new == old:
+                continue
+            cols = [c for c, cell in enumerate(new) if cell != old[c]]
+            self._rows[r] = new
+            if top is None:
+                top = r
+            bottom = r
+            left = cols[0] if left is None else min(left, cols[0])
+            right = max(right, cols[-1])
+        if top is not None:
+            self.dataChanged.emit(self.index(top, left), self.index(bottom, right))
+
+        # New keys are appended in one batch: a single insert notification
+        # and one extend() per list rather than a row-by-row growth
+        new_keys = [key for key in rows if key not in self._row_for_key]
+        if new_keys:
+            start = len(self._keys)
+            self.beginInsertRows(root, start, start + len(new_keys) - 1)
+            self._row_for_key.update(zip(new_keys, range(start, start + len(new_keys))))
+            self._keys.extend(new_keys)
+            self._rows.extend([rows[key] for key in new_keys])
+            self.endInsertRows()
+
+
+class ProcessFilterProxy(QtCore.QSortFilterProxyModel):
+    """Sort on Qt.UserRole and filter rows by name, user or PID."""
+    FILTER_COLUMNS = (0, 1, 3)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSortRole(QtCore.Qt.UserRole)
+        # Text columns sort case-insensitively here, so rows need no
+        # lower-cased copies of their strings as sort keys
+        self.setSortCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.setDynamicSortFilter(True)
+        self._needle = ""
+
+    def set_needle(self, text: str) -> None:
+        self._needle = text
+        self.invalidateFilter()
+
+    def refilter(self) -> None:
+        """Re-check every row against the filter after an in-place update."""
+        if self._needle:
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:
+        if not self._needle:
+            return True
+        model = self.sourceModel()
+        return any(
+            self._needle in model.text_at(source_row, c).lower()
+            for c in self.FILTER_COLUMNS
         )
 
 
+class PercentBarDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Paints the Qt.UserRole percentage of a cell as a progress bar.
+    Unlike a QProgressBar cell widget per row, the bar is only drawn for
+    visible cells when the view paints them.  The displayed text is the
+    cell's DisplayRole followed by "%".
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # One style option reused for every paint
+        self._bar = QtWidgets.QStyleOptionProgressBar()
+        self._bar.minimum = 0
+        self._bar.maximum = 100
+        self._bar.textVisible = True
+        self._bar.textAlignment = QtCore.Qt.AlignCenter
+
+    def sizeHint(self, option, index: QtCore.QModelIndex) -> QtCore.QSize:
+        # Leave room for a readable bar when columns are fitted to contents
+        hint = super().sizeHint(option, index)
+        return QtCore.QSize(max(hint.width(), 90), hint.height())
+
+    def paint(self, painter: QtGui.QPainter, option, index: QtCore.QModelIndex):
+        try:
+            pct = float(index.data(QtCore.Qt.UserRole))
+        except (TypeError, ValueError):
+            pct = -1.0
+        if pct < 0:  # no value: draw the plain text instead
+            super().paint(painter, option, index)
+            return
+        widget = option.widget
+        style = widget.style() if widget is not None else QtWidgets.QApplication.style()
+        style.drawPrimitive(QtWidgets.QStyle.PE_PanelItemViewItem, option, painter, widget)
+        bar = self._bar
+        bar.rect = option.rect.adjusted(1, 1, -1, -1)
+        bar.palette = option.palette
+        bar.state = option.state | QtWidgets.QStyle.State_Horizontal
+        bar.progress = int(round(max(0.0, min(100.0, pct))))
+        bar.text = f"{index.data(QtCore.Qt.DisplayRole)}%"
+        style.drawControl(QtWidgets.QStyle.CE_ProgressBar, bar, painter, widget)
+
+
 # ------------------------------- Processes tab -------------------------------
 
+class ProcessSampler(QtCore.QObject):
+    """
+    Worker living in its own QThread that walks the process list.
+    process_iter() costs several /proc reads per process, so it runs here.
+    The snapshot is delivered to the GUI thread through a queued signal in
+    struct-of-arrays form: NumPy arrays for the numeric fields (pid, cpu,
+    rss, read, write, has_io) and plain lists for the strings.
+    """
+    sampled = QtCore.pyqtSignal(object, float)
+
+    def __init__(self, attrs, parent=None):
+        super().__init__(parent)
+        self.attrs = attrs
+
+    @QtCore.pyqtSlot()
+    def prime(self):
+        """Take the per-process CPU time baselines (runs once, at thread start)."""
+        try:
+            processes.prime_cpu_percent()
+        except Exception:
+            pass
+
+    @QtCore.pyqtSlot()
+    def sample(self):
+        pids, cpu, rss, read, write, has_io = [], [], [], [], [], []
+        names, users, cmdlines = [], [], []
+        try:
+            for proc in processes.iter_processes(self.attrs):
+                info = proc.info
+                pids.append(info['pid'])
+                names.append(info.get('name') or "")
+                users.append(info.get('username') or "")
+                cpu.append(info.get('cpu_percent') or 0.0)
+                meminfo = info.get('memory_info')
+                rss.append(getattr(meminfo, 'rss', 0) if meminfo is not None else 0)
+                io = info.get('io_counters')
+                has_io.append(io is not None)
+                read.append(getattr(io, 'read_bytes', 0) if io is not None else 0)
+                write.append(getattr(io, 'write_bytes', 0) if io is not None else 0)
+                cmdlines.append(info.get('cmdline') or [])
+        except Exception:
+            pass
+        snapshot = {
+            "pid": np.array(pids, dtype=np.int64),
+            "cpu": np.maximum(np.array(cpu, dtype=np.float64), 0.0),
+            "rss": np.array(rss, dtype=np.int64),
+            "read": np.array(read, dtype=np.int64),
+            "write": np.array(write, dtype=np.int64),
+            "has_io": np.array(has_io, dtype=bool),
+            "name": names,
+            "user": users,
+            "cmdline": cmdlines,
+        }
+        self.sampled.emit(snapshot, time.monotonic())
+
+
 class ProcessesTab(QtWidgets.QWidget):
     """
     Process table (name, user, %CPU, PID, RSS, IO totals, IO rates, cmdline).
     Efficient refresh:
-      - Sorting & painting disabled during batch update.
-      - Rows updated in place; removals done in descending order.
+      - psutil sampling runs in a worker thread (ProcessSampler).
+      - Rows live in a KeyedTableModel (no per-cell QTableWidgetItems); a
+        proxy sorts on the raw values and applies the filter.
+      - Rows updated in place; only changed cells are signalled.
       - Caches cleaned when processes exit (no growth over time).
     """
     UPDATE_MS = 3000
+    # Adaptive backoff: once the BACKOFF_TOP_N busiest PIDs have stayed the
+    # same for BACKOFF_AFTER refreshes, each further refresh stretches the
+    # interval by BACKOFF_FACTOR, up to BACKOFF_MAX times update_ms.  Any
+    # change to that set restores the configured interval.
+    BACKOFF_TOP_N = 20
+    BACKOFF_AFTER = 3
+    BACKOFF_FACTOR = 1.5
+    BACKOFF_MAX = 3.0
     COLUMNS = [
         "Process Name", "User", "% CPU", "ID",
         "Memory", "Disk read total", "Disk write total",
         "Disk read", "Disk write", "Cmdline"
     ]
+    # Per-process fields fetched each refresh.  psutil fills ``proc.info``
+    # through ``Process.as_dict()``, which already runs inside
+    # ``Process.oneshot()``, so the /proc (or NtQuery) reads backing these
+    # attributes are shared per process rather than repeated per field.
+    PROC_ATTRS = (
+        'pid', 'name', 'username', 'cpu_percent',
+        'memory_info', 'io_counters', 'cmdline',
+    )
+
+    # Emitted (queued) to ask the sampler thread for a new snapshot
+    _request_sample = QtCore.pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -1606,8 +2403,25 @@ class ProcessesTab(QtWidgets.QWidget):
 
         layout.addLayout(controls)
 
-        self.table = QtWidgets.QTableWidget(0, len(self.COLUMNS))
-        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.model = KeyedTableModel(self.COLUMNS, self)
+        # Numeric columns are formatted on demand, only for visible cells
+        self.model.formats = {
+            2: fixed2,
+            4: lambda v: human_bytes(v) if v else "—",
+            5: human_bytes,
+            6: human_bytes,
+            7: human_rate_kib,
+            8: human_rate_kib,
+        }
+        self.model.tip_formats = {
+            2: lambda v: fixed2(v) + "%",
+            7: lambda v: fixed2(v) + " KiB/s",
+            8: lambda v: fixed2(v) + " KiB/s",
+        }
+        self.proxy = ProcessFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.proxy)
         self.table.setSortingEnabled(True)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         # Allow selection of multiple processes
@@ -1625,30 +2439,42 @@ class ProcessesTab(QtWidgets.QWidget):
         self.table.installEventFilter(self)
 
         # Caches used during refresh
-        self.prev_io: Dict[int, Tuple[int, int]] = {}
+        # I/O totals of the previous snapshot as PID-sorted arrays
+        # (pids, read, write, has_io) for the vectorized rate computation
+        self._prev_io: Optional[Tuple[np.ndarray, ...]] = None
         self.prev_time = time.monotonic()
-        self.row_for_pid: Dict[int, int] = {}
+        # pid -> (raw-value signature, formatted row) from the last refresh
+        self._row_sig: Dict[int, Tuple[tuple, list]] = {}
+        # pid -> ((name, user, cmdline list), name cell, user cell, cmdline cell)
+        self._text_cells: Dict[int, tuple] = {}
         self.update_ms = self.UPDATE_MS
         self.timer = QtCore.QTimer(self)
         self.timer.timeout.connect(self.refresh)
-        self._primed = False
-
-    def _item(self, text: str, sort_value=None, tip: str = "") -> QtWidgets.QTableWidgetItem:
-        it = QtWidgets.QTableWidgetItem(text)
-        it.setToolTip(tip if tip else text)
-        it.setData(QtCore.Qt.UserRole, text if sort_value is None else sort_value)
-        return it
-
-    def _set_row(self, row: int, cols):
-        for c, (txt, sortv, tip) in enumerate(cols):
-            it = self.table.item(row, c)
-            if it is None:
-                it = self._item(txt, sortv, tip)
-                self.table.setItem(row, c, it)
-            else:
-                it.setText(txt)
-                it.setToolTip(tip if tip else txt)
-                it.setData(QtCore.Qt.UserRole, txt if sortv is None else sortv)
+        self._top_pids: Optional[frozenset] = None
+        self._stable_refreshes = 0
+
+        # Process sampling runs off the GUI thread; at most one request is
+        # in flight so a slow walk never queues up behind the timer.
+        self._sampling = False
+        self._sampler_thread = QtCore.QThread(self)
+        self._sampler = ProcessSampler(self.PROC_ATTRS)
+        self._sampler.moveToThread(self._sampler_thread)
+        # The CPU% baselines are taken on the worker as soon as it starts, so
+        # the first visit to the tab neither blocks nor shows all zeros
+        self._sampler_thread.started.connect(self._sampler.prime)
+        self._request_sample.connect(self._sampler.sample)
+        self._sampler.sampled.connect(self._apply_sample)
+        self._sampler_thread.finished.connect(self._sampler.deleteLater)
+        self._sampler_thread.start()
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_sampler)
+
+    def _stop_sampler(self):
+        """Stop the sampler thread (called when the application quits)."""
+        if self._sampler_thread.isRunning():
+            self._sampler_thread.quit()
+            self._sampler_thread.wait()
 
     def table_clear_selection(self):
         """Deselect all rows in the process table."""
@@ -1682,146 +2508,152 @@ class ProcessesTab(QtWidgets.QWidget):
 
     def selected_pids(self) -> List[int]:
         """Return list of PIDs for currently selected processes."""
-        pids: List[int] = []
-        for idx in self.table.selectionModel().selectedRows():
-            item = self.table.item(idx.row(), 3)
-            if item:
-                try:
-                    pids.append(int(item.text()))
-                except ValueError:
-                    pass
-        return pids
+        return [
+            self.model.key_at(self.proxy.mapToSource(idx).row())
+            for idx in self.table.selectionModel().selectedRows()
+        ]
 
     def restore_selection(self, pids: List[int]):
         """Restore selection for *pids* and ensure the first one is visible."""
         if not pids:
             return
-        self.table.clearSelection()
-        first_row: Optional[int] = None
+        selection = QtCore.QItemSelection()
+        first: Optional[QtCore.QModelIndex] = None
         for pid in pids:
-            row = self.row_for_pid.get(pid)
-            if row is not None:
-                self.table.selectRow(row)
-                if first_row is None:
-                    first_row = row
-        if first_row is not None:
-            self.table.scrollToItem(
-                self.table.item(first_row, 0),
-                QtWidgets.QAbstractItemView.PositionAtCenter,
-            )
+            row = self.model.row_of(pid)
+            if row is None:
+                continue
+            idx = self.proxy.mapFromSource(self.model.index(row, 0))
+            if not idx.isValid():  # filtered out
+                continue
+            selection.select(idx, idx)
+            if first is None:
+                first = idx
+        self.table.selectionModel().select(
+            selection,
+            QtCore.QItemSelectionModel.ClearAndSelect | QtCore.QItemSelectionModel.Rows,
+        )
+        if first is not None:
+            self.table.scrollTo(first, QtWidgets.QAbstractItemView.PositionAtCenter)
 
     def apply_filter(self):
         """Hide rows not matching the filter text."""
-        text = self.filter_edit.text().strip().lower()
-        for row in range(self.table.rowCount()):
-            if text:
-                name = self.table.item(row, 0).text().lower()
-                user = self.table.item(row, 1).text().lower()
-                pid = self.table.item(row, 3).text().lower()
-                match = text in name or text in user or text in pid
-            else:
-                match = True
-            self.table.setRowHidden(row, not match)
+        self.proxy.set_needle(self.filter_edit.text().strip().lower())
 
     def refresh(self):
-        now = time.monotonic()
+        """Request a new process snapshot; the table updates when it arrives."""
+        if self._sampling or not self._sampler_thread.isRunning():
+            return
+        self._sampling = True
+        self._request_sample.emit()
+
+    def _apply_sample(self, snap: dict, now: float):
+        """Write a snapshot from :class:`ProcessSampler` into the table."""
+        self._sampling = False
         dt = max(1e-6, now - self.prev_time)
-        seen = set()
+        rows: Dict[int, list] = {}
+
+        # I/O rates for all processes at once: match each PID against the
+        # previous (sorted) snapshot and subtract the totals in one pass
+        pids, read, write, has_io = snap["pid"], snap["read"], snap["write"], snap["has_io"]
+        read_rate = np.zeros(len(pids))
+        write_rate = np.zeros(len(pids))
+        prev = self._prev_io
+        if prev is not None and len(prev[0]) and len(pids):
+            prev_pids, prev_read, prev_write, prev_has_io = prev
+            j = np.minimum(np.searchsorted(prev_pids, pids), len(prev_pids) - 1)
+            ok = (prev_pids[j] == pids) & prev_has_io[j] & has_io
+            scale = 1.0 / (1024.0 * dt)
+            read_rate = np.where(ok, np.maximum(read - prev_read[j], 0) * scale, 0.0)
+            write_rate = np.where(ok, np.maximum(write - prev_write[j], 0) * scale, 0.0)
+        order = np.argsort(pids)
+        self._prev_io = (pids[order], read[order], write[order], has_io[order])
 
         # Remember which processes were selected before refresh
         selected = self.selected_pids()
 
-        was_sorting = self.table.isSortingEnabled()
-        self.table.setSortingEnabled(False)
         self.table.setUpdatesEnabled(False)
 
         try:
-            for proc in processes.iter_processes([
-                'pid', 'name', 'username', 'cpu_percent',
-                'memory_info', 'io_counters', 'cmdline'
-            ]):
-                info = proc.info
-                pid = info['pid']
-                seen.add(pid)
-
-                name = info.get('name') or ""
-                user = info.get('username') or ""
-
-                cpu = max(0.0, float(info.get('cpu_percent') or 0.0))
-
-                mem_txt, mem_sort = "—", 0
-                meminfo = info.get('memory_info')
-                if meminfo is not None:
-                    rss = getattr(meminfo, 'rss', 0)
-                    if rss:
-                        mem_txt, mem_sort = human_bytes(rss), rss
+            for (pid, name, user, cpu, mem_sort, read_total, write_total,
+                 r_rate, w_rate, cmdline_list) in zip(
+                    pids.tolist(), snap["name"], snap["user"], snap["cpu"].tolist(),
+                    snap["rss"].tolist(), read.tolist(), write.tolist(),
+                    read_rate.tolist(), write_rate.tolist(), snap["cmdline"]):
+
+                # Idle processes look the same tick after tick: reuse their
+                # formatted row instead of rebuilding every cell string
+                sig = (name, user, cpu, mem_sort, read_total, write_total,
+                       r_rate, w_rate, cmdline_list)
+                cached = self._row_sig.get(pid)
+                if cached is not None and cached[0] == sig:
+                    rows[pid] = cached[1]
+                    continue
 
-                read_total = write_total = 0
-                read_rate = write_rate = 0.0
-                io = info.get('io_counters')
-                if io is not None:
-                    read_total = getattr(io, 'read_bytes', 0)
-                    write_total = getattr(io, 'write_bytes', 0)
-                    prev = self.prev_io.get(pid)
-                    if prev:
-                        read_rate  = max(0, read_total  - prev[0]) / 1024.0 / dt
-                        write_rate = max(0, write_total - prev[1]) / 1024.0 / dt
-                    self.prev_io[pid] = (read_total, write_total)
-
-                cmdline_list = info.get('cmdline') or []
-                cmdline = " ".join(cmdline_list) if cmdline_list else ""
-
-                if pid in self.row_for_pid:
-                    row = self.row_for_pid[pid]
-                else:
-                    row = self.table.rowCount()
-                    self.table.insertRow(row)
-                    self.row_for_pid[pid] = row
-
-                cols = [
-                    (name, name.lower(), cmdline or name),
-                    (user, user.lower(), user),
-                    (f"{cpu:.2f}", cpu, f"{cpu:.2f}%"),
-                    (str(pid), pid, str(pid)),
-                    (mem_txt, mem_sort, mem_txt),
-                    (human_bytes(read_total), read_total, human_bytes(read_total)),
-                    (human_bytes(write_total), write_total, human_bytes(write_total)),
-                    (human_rate_kib(read_rate), read_rate, f"{read_rate:.2f} KiB/s"),
-                    (human_rate_kib(write_rate), write_rate, f"{write_rate:.2f} KiB/s"),
-                    (cmdline if cmdline else "—", cmdline.lower() if cmdline else "", cmdline),
+                # Name/user/cmdline cells are near-constant per PID; rebuild
+                # them only for new PIDs or after an exec() changed them
+                text = self._text_cells.get(pid)
+                if text is None or text[0] != (name, user, cmdline_list):
+                    cmdline = " ".join(cmdline_list) if cmdline_list else ""
+                    text = self._text_cells[pid] = (
+                        (name, user, cmdline_list),
+                        (name, None, cmdline or name),
+                        (user, None, user),
+                        (cmdline if cmdline else "—", cmdline, cmdline),
+                    )
+                # Numeric cells carry only their value; the model formats
+                # them when (and if) a view paints them
+                pid_txt = str(pid)
+                rows[pid] = [
+                    text[1],
+                    text[2],
+                    (None, cpu, None),
+                    (pid_txt, pid, pid_txt),
+                    (None, mem_sort, None),
+                    (None, read_total, None),
+                    (None, write_total, None),
+                    (None, r_rate, None),
+                    (None, w_rate, None),
+                    text[3],
                 ]
-                self._set_row(row, cols)
-
-            # Remove finished processes safely
-            gone_pids = [pid for pid in list(self.row_for_pid.keys()) if pid not in seen]
-            rows_to_remove = []
-            for pid in gone_pids:
-                row = self.row_for_pid.pop(pid, None)
-                if row is not None:
-                    rows_to_remove.append(row)
-                self.prev_io.pop(pid, None)
-            for row in sorted(set(rows_to_remove), reverse=True):
-                if 0 <= row < self.table.rowCount():
-                    self.table.removeRow(row)
-
-            # Rebuild mapping
-            new_map: Dict[int, int] = {}
-            for r in range(self.table.rowCount()):
-                it = self.table.item(r, 3)
-                if it:
-                    try:
-                        new_map[int(it.text())] = r
-                    except ValueError:
-                        pass
-            self.row_for_pid = new_map
-            # Apply filter and restore previous selection
-            self.apply_filter()
+                self._row_sig[pid] = (sig, rows[pid])
+
+            # The model diffs the snapshot: changed cells, new and gone rows.
+            # Dynamic sorting is suspended meanwhile so the proxy re-sorts
+            # once for the whole batch instead of per change signal.
+            self.proxy.setDynamicSortFilter(False)
+            try:
+                self.model.update(rows)
+            finally:
+                self.proxy.setDynamicSortFilter(True)  # sorts once
+            # Re-enabling only re-sorts: rows whose name, user or command
+            # changed in place must be matched against the filter again
+            self.proxy.refilter()
+            # Both per-PID caches are pruned with one set difference
+            for pid in self._row_sig.keys() - rows.keys():
+                del self._row_sig[pid]
+                self._text_cells.pop(pid, None)
             self.restore_selection(selected)
 
         finally:
             self.prev_time = now
             self.table.setUpdatesEnabled(True)
-            self.table.setSortingEnabled(was_sorting)
+        self._adapt_interval(pids, snap["cpu"])
+
+    def _adapt_interval(self, pids: np.ndarray, cpu: np.ndarray):
+        """Back the refresh interval off while the busiest processes are stable."""
+        top = frozenset(pids[np.argsort(cpu, kind="stable")[-self.BACKOFF_TOP_N:]].tolist())
+        if top == self._top_pids:
+            self._stable_refreshes += 1
+        else:
+            self._top_pids = top
+            self._stable_refreshes = 0
+        if self._stable_refreshes >= self.BACKOFF_AFTER:
+            ms = min(self.timer.interval() * self.BACKOFF_FACTOR, self.update_ms * self.BACKOFF_MAX)
+        else:
+            ms = self.update_ms
+        if self.timer.isActive() and int(ms) != self.timer.interval():
+            self.timer.setInterval(int(ms))
 
     def eventFilter(self, obj, event):
         """Handle custom shortcuts for the processes table."""
@@ -1834,9 +2666,7 @@ class ProcessesTab(QtWidgets.QWidget):
         return super().eventFilter(obj, event)
 
     def showEvent(self, e: QtGui.QShowEvent):
-        if not self._primed:
-            processes.prime_cpu_percent()
-            self._primed = True
+        self._stable_refreshes = 0
         self.timer.start(self.update_ms)
         super().showEvent(e)
 
@@ -1846,12 +2676,102 @@ class ProcessesTab(QtWidgets.QWidget):
 
     def set_update_ms(self, ms: int):
         self.update_ms = max(50, int(ms))
+        self._stable_refreshes = 0
         if self.timer.isActive():
             self.timer.start(self.update_ms)
 
 
 # ------------------------------- File Systems tab -------------------------------
 
+class DiskSampler(QtCore.QObject):
+    """
+    Worker living in its own QThread that gathers the file-system tables.
+    statvfs() on every mount and the /proc/diskstats read can stall on slow
+    or network mounts, so the rows are built here and handed to the GUI
+    thread as a plain dict through a queued signal.
+    The partition list is cached: it is re-enumerated when the tab reports a
+    mount change (see invalidate_mounts) or after MOUNTS_TTL seconds.
+    """
+    sampled = QtCore.pyqtSignal(object)
+    MOUNTS_TTL = 30.0
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._mounts: Optional[List[Tuple[str, str, str]]] = None
+        self._mounts_stamp = 0.0
+        # disk -> (totals, row) from the previous pass
+        self._disk_prev: Dict[str, tuple] = {}
+
+    def invalidate_mounts(self, *_):
+        """Forget the cached partition list (the mount table changed)."""
+        self._mounts = None
+
+    @QtCore.pyqtSlot()
+    def sample(self):
+        data = {}
+        for key, build in (("mounts", self._mount_rows), ("disks", self._disk_rows)):
+            try:
+                data[key] = build()
+            except Exception:
+                pass
+        self.sampled.emit(data)
+
+    def _mount_rows(self) -> Dict[str, list]:
+        now = time.monotonic()
+        if self._mounts is None or now - self._mounts_stamp > self.MOUNTS_TTL:
+            self._mounts = disks.mounts()
+            self._mounts_stamp = now
+        mounts: Dict[str, list] = {}
+        for dev, mnt, fstype, usage, reason in disks.partitions(self._mounts):
+            if usage is None:
+                # Network mount not probed, or statvfs() did not answer in time
+                if reason == disks.USAGE_TIMED_OUT:
+                    tip = "Usage timed out"
+                else:
+                    tip = "Usage not queried for network mounts"
+                mounts[mnt] = [(dev, None, dev), (mnt, None, mnt), (fstype, None, fstype)]
+                mounts[mnt] += [("—", -1, tip)] * 4
+                continue
+            mounts[mnt] = [
+                (dev, None, dev),
+                (mnt, None, mnt),
+                (fstype, None, fstype),
+                (human_bytes(usage.total), usage.total, ""),
+                (human_bytes(usage.used), usage.used, ""),
+                (human_bytes(usage.free), usage.free, ""),
+                # Drawn as a bar by PercentBarDelegate from the sort value
+                (f"{usage.percent:.1f}", usage.percent, ""),
+            ]
+        return mounts
+
+    def _disk_rows(self) -> Dict[str, list]:
+        io_rows: Dict[str, list] = {}
+        prev = self._disk_prev
+        totals_by_disk = disks.io_totals()
+        for disk, totals in totals_by_disk.items():
+            cached = prev.get(disk)
+            if cached is not None and cached[0] == totals:
+                # Idle disk: the totals (and so the row) did not move
+                io_rows[disk] = cached[1]
+                continue
+            (read_count, write_count, read_bytes, write_bytes,
+             read_time, write_time, busy) = totals
+            io_rows[disk] = [
+                (disk, None, disk),
+                # Text is formatted by the model's ``formats``, for visible cells only
+                (None, read_count, None),
+                (None, write_count, None),
+                (None, read_bytes, None),
+                (None, write_bytes, None),
+                (None, read_time, None),
+                (None, write_time, None),
+                (None, busy if busy is not None else -1, None),
+            ]
+        # Rebuilt each pass so vanished disks drop out of the cache
+        self._disk_prev = {disk: (totals, io_rows[disk]) for disk, totals in totals_by_disk.items()}
+        return io_rows
+
+
 class FileSystemsTab(QtWidgets.QWidget):
     """Display mounted partitions and per-disk I/O totals.
 
@@ -1864,6 +2784,12 @@ class FileSystemsTab(QtWidgets.QWidget):
     # Default refresh cadence (milliseconds)
     UPDATE_MS = 3000
 
+    # Showing the tab again within this many seconds reuses the last sample
+    MIN_REFRESH_S = 1.0
+
+    # Emitted (queued) to ask the sampler thread for new statistics
+    _request_sample = QtCore.pyqtSignal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         main = QtWidgets.QVBoxLayout(self)
@@ -1873,11 +2799,12 @@ class FileSystemsTab(QtWidgets.QWidget):
         # --- Mounted file systems ---
         self.mounts_label = QtWidgets.QLabel("Mounted File Systems")
         self.mounts_label.setStyleSheet("font-weight:bold;")
-        self.mounts = QtWidgets.QTableWidget(0, 7)
-        self.mounts.setHorizontalHeaderLabels(
-            ["Device", "Mount", "Type", "Total", "Used", "Free", "%"]
+        self.mounts_model = KeyedTableModel(
+            ["Device", "Mount", "Type", "Total", "Used", "Free", "%"], self
         )
-        self.mounts.setSortingEnabled(True)
+        self.mounts = self._make_view(self.mounts_model)
+        # Usage bars are painted by a delegate, only for visible cells
+        self.mounts.setItemDelegateForColumn(6, PercentBarDelegate(self.mounts))
         self.mounts.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.mounts.verticalHeader().setVisible(False)
         self.mounts.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
@@ -1889,8 +2816,7 @@ class FileSystemsTab(QtWidgets.QWidget):
         # --- Disk I/O table ---
         self.io_label = QtWidgets.QLabel("Disk I/O")
         self.io_label.setStyleSheet("font-weight:bold;")
-        self.disks = QtWidgets.QTableWidget(0, 8)
-        self.disks.setHorizontalHeaderLabels(
+        self.disks_model = KeyedTableModel(
             [
                 "Disk",
                 "Reads",
@@ -1900,9 +2826,20 @@ class FileSystemsTab(QtWidgets.QWidget):
                 "Read time ms",
                 "Write time ms",
                 "Busy ms",
-            ]
+            ],
+            self,
         )
-        self.disks.setSortingEnabled(True)
+        # Counters are formatted on demand, only for visible cells
+        self.disks_model.formats = {
+            1: str,
+            2: str,
+            3: human_bytes,
+            4: human_bytes,
+            5: str,
+            6: str,
+            7: lambda v: str(v) if v >= 0 else "-",
+        }
+        self.disks = self._make_view(self.disks_model)
         self.disks.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.disks.verticalHeader().setVisible(False)
         self.disks.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
@@ -1921,89 +2858,92 @@ class FileSystemsTab(QtWidgets.QWidget):
         self.timer = QtCore.QTimer(self)
         self.timer.timeout.connect(self.refresh)
 
+        # Disk sampling runs off the GUI thread, one request at a time
+        self._sampling = False
+        self._fitted = False
+        self._last_refresh = 0.0
+        self._sampler_thread = QtCore.QThread(self)
+        self._sampler = DiskSampler()
+        self._sampler.moveToThread(self._sampler_thread)
+        self._request_sample.connect(self._sampler.sample)
+        self._sampler.sampled.connect(self._apply_sample)
+        self._sampler_thread.finished.connect(self._sampler.deleteLater)
+        self._sampler_thread.start()
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_sampler)
+
+        # On Linux the kernel flags /proc/self/mountinfo with POLLPRI whenever
+        # the mount table changes, so the cached partition list is dropped
+        # exactly when needed instead of being re-enumerated every refresh.
+        self._mountinfo_fd: Optional[int] = None
+        if sys.platform.startswith("linux"):
+            try:
+                self._mountinfo_fd = os.open("/proc/self/mountinfo", os.O_RDONLY)
+                self._mount_notifier = QtCore.QSocketNotifier(
+                    self._mountinfo_fd, QtCore.QSocketNotifier.Exception, self
+                )
+                self._mount_notifier.activated.connect(self._sampler.invalidate_mounts)
+            except OSError:
+                self._mountinfo_fd = None
+
         # Populate once so the user sees something immediately
         self.refresh()
-        # Auto-fit columns initially but keep user sizes afterwards
-        self.mounts.resizeColumnsToContents()
-        self.disks.resizeColumnsToContents()
 
-    def refresh(self):
-        # Preserve current sort and scroll position so that refreshing does not
-        # disturb the user's view.  Sorting is temporarily disabled while the
-        # tables are rebuilt to prevent rows from jumping around or cell
-        # widgets (progress bars) from being dropped.
-
-        # ----- Mounted partitions -----
-        m_header = self.mounts.horizontalHeader()
-        m_sort_col = m_header.sortIndicatorSection()
-        m_sort_order = m_header.sortIndicatorOrder()
-        m_scroll = self.mounts.verticalScrollBar().value()
-        self.mounts.setSortingEnabled(False)
-        self.mounts.setRowCount(0)
-        parts = disks.partitions()
-        for dev, mnt, fstype, usage in parts:
-            if usage is None:
-                continue
-            row = self.mounts.rowCount()
-            self.mounts.insertRow(row)
-            self.mounts.setItem(row, 0, QtWidgets.QTableWidgetItem(dev))
-            self.mounts.setItem(row, 1, QtWidgets.QTableWidgetItem(mnt))
-            self.mounts.setItem(row, 2, QtWidgets.QTableWidgetItem(fstype))
-            self.mounts.setItem(
-                row, 3, QtWidgets.QTableWidgetItem(human_bytes(usage.total))
-            )
-            self.mounts.setItem(
-                row, 4, QtWidgets.QTableWidgetItem(human_bytes(usage.used))
-            )
-            self.mounts.setItem(
-                row, 5, QtWidgets.QTableWidgetItem(human_bytes(usage.free))
-            )
+    def _make_view(self, model: KeyedTableModel) -> QtWidgets.QTableView:
+        """Table view over *model*, sorted on the raw values through a proxy."""
+        proxy = QtCore.QSortFilterProxyModel(self)
+        proxy.setSourceModel(model)
+        proxy.setSortRole(QtCore.Qt.UserRole)
+        proxy.setDynamicSortFilter(True)
+        view = QtWidgets.QTableView()
+        view.setModel(proxy)
+        view.setSortingEnabled(True)
+        return view
 
-            # Progress bar in the percentage column for an at-a-glance view of
-            # disk usage.  We still keep a hidden QTableWidgetItem so that
-            # sorting remains numeric rather than lexical.
-            percent_item = QtWidgets.QTableWidgetItem(f"{usage.percent:.1f}")
-            percent_item.setData(QtCore.Qt.UserRole, usage.percent)
-            self.mounts.setItem(row, 6, percent_item)
-            bar = QtWidgets.QProgressBar()
-            bar.setRange(0, 100)
-            bar.setValue(int(round(usage.percent)))
-            bar.setFormat(f"{usage.percent:.1f}%")
-            bar.setAlignment(QtCore.Qt.AlignCenter)
-            self.mounts.setCellWidget(row, 6, bar)
-
-        self.mounts.setSortingEnabled(True)
-        self.mounts.sortItems(m_sort_col, m_sort_order)
-        self.mounts.verticalScrollBar().setValue(m_scroll)
-
-        # ----- Per-disk I/O totals -----
-        d_header = self.disks.horizontalHeader()
-        d_sort_col = d_header.sortIndicatorSection()
-        d_sort_order = d_header.sortIndicatorOrder()
-        d_scroll = self.disks.verticalScrollBar().value()
-        self.disks.setSortingEnabled(False)
-        self.disks.setRowCount(0)
-        io_per = disks.io_counters()
-        for disk, io in io_per.items():
-            row = self.disks.rowCount()
-            self.disks.insertRow(row)
-            self.disks.setItem(row, 0, QtWidgets.QTableWidgetItem(disk))
-            self.disks.setItem(row, 1, QtWidgets.QTableWidgetItem(str(getattr(io, 'read_count', 0))))
-            self.disks.setItem(row, 2, QtWidgets.QTableWidgetItem(str(getattr(io, 'write_count', 0))))
-            self.disks.setItem(row, 3, QtWidgets.QTableWidgetItem(human_bytes(getattr(io, 'read_bytes', 0))))
-            self.disks.setItem(row, 4, QtWidgets.QTableWidgetItem(human_bytes(getattr(io, 'write_bytes', 0))))
-            self.disks.setItem(row, 5, QtWidgets.QTableWidgetItem(str(getattr(io, 'read_time', 0))))
-            self.disks.setItem(row, 6, QtWidgets.QTableWidgetItem(str(getattr(io, 'write_time', 0))))
-            busy = getattr(io, 'busy_time', None)
-            self.disks.setItem(row, 7, QtWidgets.QTableWidgetItem(str(busy) if busy is not None else "-"))
-
-        self.disks.setSortingEnabled(True)
-        self.disks.sortItems(d_sort_col, d_sort_order)
-        self.disks.verticalScrollBar().setValue(d_scroll)
+    def refresh(self):
+        """Request new disk statistics; the tables update when they arrive."""
+        if self._sampling or not self._sampler_thread.isRunning():
+            return
+        self._sampling = True
+        self._last_refresh = time.monotonic()
+        self._request_sample.emit()
+
+    def refresh_if_stale(self):
+        """Refresh unless the last request is younger than MIN_REFRESH_S."""
+        if time.monotonic() - self._last_refresh >= self.MIN_REFRESH_S:
+            self.refresh()
+
+    def _apply_sample(self, data: dict):
+        """Write a snapshot from :class:`DiskSampler` into both tables."""
+        self._sampling = False
+        # The models are updated in place, so the current sort order, scroll
+        # position and selection survive a refresh untouched.
+        # A table whose sampling failed keeps its previous contents
+        if "mounts" in data:
+            self.mounts_model.update(data["mounts"])
+        if "disks" in data:
+            self.disks_model.update(data["disks"])
+        if not self._fitted:
+            # Auto-fit columns once but keep user sizes afterwards
+            self.mounts.resizeColumnsToContents()
+            self.disks.resizeColumnsToContents()
+            self._fitted = True
+
+    def _stop_sampler(self):
+        """Stop the sampler thread (called when the application quits)."""
+        if self._sampler_thread.isRunning():
+            self._sampler_thread.quit()
+            self._sampler_thread.wait()
+        if self._mountinfo_fd is not None:
+            self._mount_notifier.setEnabled(False)
+            os.close(self._mountinfo_fd)
+            self._mountinfo_fd = None
 
     def showEvent(self, e: QtGui.QShowEvent):
         """Start refreshing when the tab becomes visible."""
-        self.refresh()
+        # Rapid tab switching must not statvfs every mount on each show
+        self.refresh_if_stale()
         self.timer.start(self.update_ms)
         super().showEvent(e)
 
@@ -2042,6 +2982,7 @@ class PreferencesDialog(QtWidgets.QDialog):
       - Fill CPU graphs with transparency
       - Smooth network graph (EMA)
       - Enable/disable antialiasing
+      - OpenGL rendering for the main plots
       - CPU view mode
       - Mini plot size/columns and mono color for Multi window mode
       - Theme selection
@@ -2051,7 +2992,7 @@ class PreferencesDialog(QtWidgets.QDialog):
         resources_tab: ResourcesTab,
         processes_tab: ProcessesTab,
         filesystems_tab: FileSystemsTab,
-        themes: Dict[str, QtGui.QPalette],
+        themes: Mapping,
         current_theme: str,
         parent=None,
     ):
@@ -2159,6 +3100,8 @@ class PreferencesDialog(QtWidgets.QDialog):
 
         self.in_antialias = QtWidgets.QCheckBox("Enable antialiasing (smooth curves)")
         self.in_antialias.setChecked(resources_tab.ANTIALIAS)
+        self.in_opengl = QtWidgets.QCheckBox("Use OpenGL for plots (GPU rendering)")
+        self.in_opengl.setChecked(resources_tab.USE_OPENGL)
         self.in_cpu_mode = QtWidgets.QComboBox()
         for name in ResourcesTab.CPU_VIEW_MODES:
             self.in_cpu_mode.addItem(name)
@@ -2311,6 +3254,12 @@ class PreferencesDialog(QtWidgets.QDialog):
             "Enable antialiasing for smoother but slower rendering."
         )
         global_form.addRow(self.in_antialias)
+        self.in_opengl.setToolTip(
+            "Draw the CPU, memory and network plots through OpenGL. Lowers CPU "
+            "usage with many curves (most noticeable above 16 CPU threads); "
+            "falls back to normal rendering if OpenGL is unavailable."
+        )
+        global_form.addRow(self.in_opengl)
         # Allow toggling translucent fill for the average CPU curve
         self.in_cpu_fill.setToolTip(
             "Fill the average CPU graph with a translucent colour."
@@ -2424,6 +3373,11 @@ class PreferencesDialog(QtWidgets.QDialog):
         lay.addWidget(scroll)
         lay.addWidget(btns)
 
+        # The widgets start out mirroring the live settings; apply() only
+        # pushes what differs from the last applied state
+        self._applied = self._read_values()
+        self._applied_settings = self._resource_settings(self._applied)
+
     def _update_mono_btn(self):
         self.in_mono_btn.setStyleSheet(f"background-color: {self.mono_color.name()};")
 
@@ -2480,6 +3434,7 @@ class PreferencesDialog(QtWidgets.QDialog):
             bool(self.in_smooth.isChecked()),
             bool(self.in_extra.isChecked()),
             bool(self.in_antialias.isChecked()),
+            bool(self.in_opengl.isChecked()),
             self.in_cpu_mode.currentText(),
             bool(self.in_cpu_fill.isChecked()),
             bool(self.in_net_smooth.isChecked()),
@@ -2496,14 +3451,16 @@ class PreferencesDialog(QtWidgets.QDialog):
             self.in_theme.currentText(),
         )
 
-    def apply(self):
+    @staticmethod
+    def _resource_settings(values: tuple) -> Dict[str, object]:
+        """apply_settings() keywords from a _read_values() tuple."""
         (
-            dpi_scale,
+            _dpi_scale,
             history,
             plot_ms,
             text_ms,
-            proc_ms,
-            fs_ms,
+            _proc_ms,
+            _fs_ms,
             ema,
             mem_ema,
             net_ema,
@@ -2516,6 +3473,7 @@ class PreferencesDialog(QtWidgets.QDialog):
             smooth,
             extra,
             antialias,
+            use_opengl,
             cpu_mode,
             fill_cpu,
             net_smooth,
@@ -2529,12 +3487,9 @@ class PreferencesDialog(QtWidgets.QDialog):
             label_match,
             label_color,
             general_color,
-            theme_name,
-        ) = self._read_values()
-        parent = self.parent()
-        if parent is not None and hasattr(parent, "set_dpi_scale"):
-            parent.set_dpi_scale(dpi_scale)
-        self.resources_tab.apply_settings(
+            _theme_name,
+        ) = values
+        return dict(
             history_seconds=history,
             plot_update_ms=plot_ms,
             text_update_ms=text_ms,
@@ -2549,6 +3504,7 @@ class PreferencesDialog(QtWidgets.QDialog):
             smooth_graphs=smooth,
             extra_smoothing=extra,
             antialias=antialias,
+            use_opengl=use_opengl,
             cpu_view_mode=cpu_mode,
             fill_cpu=fill_cpu,
             smooth_net_graph=net_smooth,
@@ -2564,8 +3520,62 @@ class PreferencesDialog(QtWidgets.QDialog):
             label_match=label_match,
             label_color=label_color,
         )
-        self.processes_tab.set_update_ms(proc_ms)
-        self.filesystems_tab.set_update_ms(fs_ms)
+
+    def apply(self):
+        values = self._read_values()
+        prev = self._applied
+        if values == prev:
+            return  # nothing changed since the last Apply
+        (
+            dpi_scale,
+            history,
+            plot_ms,
+            text_ms,
+            proc_ms,
+            fs_ms,
+            ema,
+            mem_ema,
+            net_ema,
+            show_freq,
+            show_temp,
+            width,
+            grid_x,
+            grid_y,
+            grid_divs,
+            smooth,
+            extra,
+            antialias,
+            use_opengl,
+            cpu_mode,
+            fill_cpu,
+            net_smooth,
+            mini_w,
+            mini_h,
+            multi_cols,
+            multi_axes,
+            mono_chk,
+            mono_color,
+            label_pos,
+            label_match,
+            label_color,
+            general_color,
+            theme_name,
+        ) = values
+        parent = self.parent()
+        if parent is not None and hasattr(parent, "set_dpi_scale") and dpi_scale != prev[0]:
+            parent.set_dpi_scale(dpi_scale)
+        # Only the settings that changed reach the Resources tab; cheap ones
+        # (timers, grids, alphas...) are applied in place without a rebuild
+        settings = self._resource_settings(values)
+        changed = {k: v for k, v in settings.items() if self._applied_settings.get(k) != v}
+        if changed and not self.resources_tab.apply_partial(changed):
+            self.resources_tab.apply_settings(**settings)
+        self._applied = values
+        self._applied_settings = settings
+        if proc_ms != prev[4]:
+            self.processes_tab.set_update_ms(proc_ms)
+        if fs_ms != prev[5]:
+            self.filesystems_tab.set_update_ms(fs_ms)
         if parent is not None and hasattr(parent, "save_preferences"):
             parent.save_preferences(
                 {
@@ -2587,6 +3597,7 @@ class PreferencesDialog(QtWidgets.QDialog):
                     "smooth_graphs": smooth,
                     "extra_smoothing": extra,
                     "antialias": antialias,
+                    "use_opengl": use_opengl,
                     "cpu_view_mode": cpu_mode,
                     "fill_cpu": fill_cpu,
                     "smooth_net_graph": net_smooth,
@@ -2602,7 +3613,7 @@ class PreferencesDialog(QtWidgets.QDialog):
                     "cpu_label_color": label_color,
                 }
             )
-        if parent is not None and hasattr(parent, "apply_theme"):
+        if parent is not None and hasattr(parent, "apply_theme") and theme_name != prev[-1]:
             parent.apply_theme(theme_name)
 
     def accept(self):
@@ -2633,6 +3644,7 @@ class PreferencesDialog(QtWidgets.QDialog):
         self.in_cpu_fill.setChecked(ResourcesTab.FILL_CPU)
         self.in_net_smooth.setChecked(ResourcesTab.SMOOTH_NET_GRAPH)
         self.in_antialias.setChecked(ResourcesTab.ANTIALIAS)
+        self.in_opengl.setChecked(ResourcesTab.USE_OPENGL)
         self.in_cpu_mode.setCurrentText(ResourcesTab.CPU_VIEW_MODE)
         self.in_mini_w.setValue(ResourcesTab.CPU_MINI_MIN_W)
         self.in_mini_h.setValue(ResourcesTab.CPU_MINI_MIN_H)
@@ -2838,12 +3850,15 @@ class MainWindow(QtWidgets.QMainWindow):
             self._base_point_size = float(self._base_font.pointSize())
         self.dpi_scale = 100
 
+        # One open attempt instead of exists() + read; the palette is applied
+        # before the first paint so the window never shows unthemed
         default_theme = DEFAULT_THEME
-        if self.theme_file.exists():
-            try:
-                default_theme = self.theme_file.read_text().strip() or default_theme
-            except Exception:
-                pass
+        self._saved_theme: Optional[str] = None
+        try:
+            self._saved_theme = self.theme_file.read_text().strip()
+            default_theme = self._saved_theme or default_theme
+        except Exception:
+            pass
         self.apply_theme(default_theme)
         self._load_preferences()
         # Ensure only the active tab (Resources by default) has its refresh
@@ -2866,6 +3881,19 @@ class MainWindow(QtWidgets.QMainWindow):
         dlg = AboutDialog(self)
         dlg.exec_()
 
+    def changeEvent(self, event: QtCore.QEvent):  # type: ignore[override]
+        if event.type() == QtCore.QEvent.WindowStateChange:
+            # Nothing is on screen while minimized: stop the table refreshes
+            # and resource labels, then bring the current tab up to date
+            if self.isMinimized():
+                self.processes_tab.timer.stop()
+                self.filesystems_tab.timer.stop()
+                self.resources_tab.set_minimized(True)
+            elif event.oldState() & QtCore.Qt.WindowMinimized:
+                self.resources_tab.set_minimized(False)
+                self._on_tab_changed(self.tabs.currentIndex())
+        super().changeEvent(event)
+
     def _on_tab_changed(self, index: int) -> None:
         """Start or stop refresh timers when tabs are switched."""
         if index == 1:  # Processes tab
@@ -2873,7 +3901,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.processes_tab.timer.start(self.processes_tab.update_ms)
             self.filesystems_tab.timer.stop()
         elif index == 2:  # File Systems tab
-            self.filesystems_tab.refresh()
+            self.filesystems_tab.refresh_if_stale()
             self.filesystems_tab.timer.start(self.filesystems_tab.update_ms)
             self.processes_tab.timer.stop()
         else:  # Resources tab
@@ -2934,8 +3962,11 @@ class MainWindow(QtWidgets.QMainWindow):
         pg.setConfigOption('foreground', palette.color(QtGui.QPalette.WindowText))
         self.resources_tab.apply_theme(palette)
         self.current_theme = name
+        if name == self._saved_theme:
+            return  # already on disk (e.g. the theme just loaded at startup)
         try:
-            self.theme_file.write_text(name)
+            write_text_atomic(self.theme_file, name)
+            self._saved_theme = name
         except Exception:
             pass
 
@@ -2962,6 +3993,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 smooth_graphs=data.get("smooth_graphs", self.resources_tab.SMOOTH_GRAPHS),
                 extra_smoothing=data.get("extra_smoothing", self.resources_tab.EXTRA_SMOOTHING),
                 antialias=data.get("antialias", self.resources_tab.ANTIALIAS),
+                use_opengl=data.get("use_opengl", self.resources_tab.USE_OPENGL),
                 cpu_view_mode=data.get("cpu_view_mode", self.resources_tab.CPU_VIEW_MODE),
                 fill_cpu=data.get("fill_cpu", self.resources_tab.FILL_CPU),
                 smooth_net_graph=data.get("smooth_net_graph", self.resources_tab.SMOOTH_NET_GRAPH),
@@ -2995,7 +4027,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def save_preferences(self, data: Dict[str, object]):
         try:
-            self.settings_file.write_text(json.dumps(data, indent=2))
+            write_text_atomic(self.settings_file, json.dumps(data, indent=2))
         except Exception:
             pass
 
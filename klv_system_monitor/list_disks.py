@@ -6,32 +6,47 @@ list_disks.py — Safe disk partitions and usage (Windows/Linux).
 - Avoids WinError 21 (device not ready) by filtering CD-ROM / empty removable volumes.
 - Ignores mountpoints that don’t exist or can’t be accessed.
 - Provides helpers to list partitions and disk I/O counters.
+- On Linux the per-disk totals are parsed straight from /proc/diskstats.
 - When executed as a script it prints a table similar to the original
   stand-alone tool.
 """
 
 from __future__ import annotations
 
+import atexit
 import os
 import sys
 import psutil
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import List, Tuple, Optional, Dict
 
 
+_UNITS = ("B", "KiB", "MiB", "GiB", "TiB", "PiB")
+
+
 def human_bytes(n: float) -> str:
     """Convert bytes into a human-readable string."""
-    units = ["B", "KiB", "MiB", "GiB", "TiB", "PiB"]
-    i = 0
     n = float(n)
-    while n >= 1024 and i < len(units) - 1:
-        n /= 1024.0
-        i += 1
-    return f"{n:.1f} {units[i]}"
+    # Unit index from the bit length (10 bits per unit) instead of a loop
+    i = min((int(n).bit_length() - 1) // 10, len(_UNITS) - 1) if n >= 1024 else 0
+    return f"{n / (1 << (10 * i)):.1f} {_UNITS[i]}"
 
 
-def safe_partitions() -> List[Tuple[str, str, str, Optional[psutil._common.sdiskusage]]]:
-    """Return tuples (device, mountpoint, fstype, usage or None) safely."""
-    parts = []
+# Network/remote file systems whose statvfs() can block for a long time (or
+# indefinitely on a stale share); their usage is not probed by default.
+SLOW_FSTYPES = frozenset({
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "autofs", "fuse.sshfs", "davfs",
+})
+
+
+def mounted_partitions() -> List[Tuple[str, str, str]]:
+    """Return tuples (device, mountpoint, fstype) for the listable partitions.
+
+    Enumerating partitions is the expensive half of safe_partitions() and the
+    mount set rarely changes, so callers may cache this list and pass it back
+    in; only the per-mount usage needs re-reading on every refresh.
+    """
+    mounts = []
     is_win = sys.platform.startswith("win")
     try:
         p_list = psutil.disk_partitions(all=False)
@@ -52,15 +67,92 @@ def safe_partitions() -> List[Tuple[str, str, str, Optional[psutil._common.sdisk
         if not os.path.exists(p.mountpoint):
             continue
 
-        usage = None
-        try:
-            usage = psutil.disk_usage(p.mountpoint)
-        except (PermissionError, OSError):
-            continue
-        except Exception:
+        mounts.append((p.device or "-", p.mountpoint, p.fstype or "-"))
+    return mounts
+
+
+# statvfs() calls for several mounts are issued concurrently so a refresh
+# takes as long as the slowest mount rather than the sum of all of them.
+STATVFS_WORKERS = 8
+STATVFS_TIMEOUT = 1.0  # seconds; slower mounts are listed without usage
+_statvfs_pool: Optional[ThreadPoolExecutor] = None
+# mountpoint -> statvfs() future that has not finished yet; a hung mount
+# keeps its single worker instead of taking a new one on every refresh
+_statvfs_pending: Dict[str, Future] = {}
+_USAGE_FAILED = object()
+
+# Why a partition is listed without usage (last field of safe_partitions())
+USAGE_SKIPPED = "skipped"      # SLOW_FSTYPES mount, not probed
+USAGE_TIMED_OUT = "timed out"  # statvfs() did not answer in STATVFS_TIMEOUT
+
+
+def _usage_or_failed(mountpoint: str):
+    try:
+        return psutil.disk_usage(mountpoint)
+    except Exception:
+        return _USAGE_FAILED
+
+
+def _disk_usages(mountpoints: List[str]) -> list:
+    """disk_usage() for every mount point, run in parallel.
+
+    Returns one entry per mount point: the usage, ``None`` when it did not
+    answer within STATVFS_TIMEOUT, or ``_USAGE_FAILED`` when it raised.
+    """
+    global _statvfs_pool
+    if len(mountpoints) <= 1:
+        return [_usage_or_failed(m) for m in mountpoints]
+    if _statvfs_pool is None:
+        _statvfs_pool = ThreadPoolExecutor(
+            max_workers=STATVFS_WORKERS, thread_name_prefix="statvfs"
+        )
+    futures = []
+    for m in mountpoints:
+        fut = _statvfs_pending.get(m)
+        if fut is None:
+            fut = _statvfs_pool.submit(_usage_or_failed, m)
+            _statvfs_pending[m] = fut
+        futures.append(fut)
+    wait(futures, timeout=STATVFS_TIMEOUT)
+    results = []
+    for m, fut in zip(mountpoints, futures):
+        if not fut.done() and not fut.cancel():
+            # Still blocked in statvfs(): reuse this future next time
+            results.append(None)
             continue
+        del _statvfs_pending[m]
+        results.append(None if fut.cancelled() else fut.result())
+    return results
+
+
+def safe_partitions(
+    mounts: Optional[List[Tuple[str, str, str]]] = None,
+    probe_slow: bool = False,
+) -> List[Tuple[str, str, str, Optional[psutil._common.sdiskusage], Optional[str]]]:
+    """Return tuples (device, mountpoint, fstype, usage, reason) safely.
 
-        parts.append((p.device or "-", p.mountpoint, p.fstype or "-", usage))
+    *mounts* is a list from mounted_partitions(); it is enumerated afresh
+    when omitted.  Mounts of a SLOW_FSTYPES type are listed with usage
+    ``None`` and reason USAGE_SKIPPED unless *probe_slow* is set; mounts
+    whose statvfs() did not answer within STATVFS_TIMEOUT get
+    USAGE_TIMED_OUT.  *reason* is ``None`` whenever usage is present.
+    """
+    if mounts is None:
+        mounts = mounted_partitions()
+    probed = [m for m in mounts if probe_slow or m[2] not in SLOW_FSTYPES]
+    usages = dict(zip((m[1] for m in probed), _disk_usages([m[1] for m in probed])))
+
+    parts = []
+    for device, mountpoint, fstype in mounts:
+        if mountpoint not in usages:
+            parts.append((device, mountpoint, fstype, None, USAGE_SKIPPED))
+            continue
+        usage = usages[mountpoint]
+        if usage is _USAGE_FAILED:
+            # Inaccessible mount (permissions, device gone): leave it out
+            continue
+        reason = USAGE_TIMED_OUT if usage is None else None
+        parts.append((device, mountpoint, fstype, usage, reason))
     return parts
 
 
@@ -72,13 +164,101 @@ def disk_io_counters() -> Dict[str, psutil._common.sdiskio]:
         return {}
 
 
+# Order of the values in the tuples returned by disk_io_totals()
+DISK_IO_FIELDS = (
+    "read_count", "write_count", "read_bytes", "write_bytes",
+    "read_time", "write_time", "busy_time",
+)
+DISK_SECTOR_SIZE = 512
+# Loop and RAM disks are virtual and usually idle; they only clutter the table
+_SKIP_DISK_PREFIXES = (b"loop", b"ram")
+
+
+# /proc/diskstats stays open for the life of the process; pread() from
+# offset 0 returns fresh contents each time
+_diskstats_fd: Optional[int] = None
+
+
+def _diskstats_bytes() -> bytes:
+    """Whole contents of /proc/diskstats through the persistent descriptor."""
+    global _diskstats_fd
+    if _diskstats_fd is None:
+        _diskstats_fd = os.open("/proc/diskstats", os.O_RDONLY)
+    # A seq_file hands out about one page per read: read on until EOF
+    chunks = []
+    offset = 0
+    while True:
+        chunk = os.pread(_diskstats_fd, 65536, offset)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+        offset += len(chunk)
+
+
+def _close_diskstats_fd() -> None:
+    if _diskstats_fd is not None:
+        try:
+            os.close(_diskstats_fd)
+        except OSError:
+            pass
+
+
+atexit.register(_close_diskstats_fd)
+
+
+def _read_diskstats() -> Dict[str, Tuple[int, ...]]:
+    """Parse /proc/diskstats line by line into DISK_IO_FIELDS tuples."""
+    out: Dict[str, Tuple[int, ...]] = {}
+    for line in _diskstats_bytes().splitlines():
+        fields = line.split()
+        if len(fields) < 7:
+            continue
+        name = fields[2]
+        if name.startswith(_SKIP_DISK_PREFIXES):
+            continue
+        if len(fields) >= 14:
+            # major minor name reads merged sectors ms writes merged
+            # sectors ms in_flight io_ticks ...
+            out[name.decode()] = (
+                int(fields[3]), int(fields[7]),
+                int(fields[5]) * DISK_SECTOR_SIZE, int(fields[9]) * DISK_SECTOR_SIZE,
+                int(fields[6]), int(fields[10]), int(fields[12]),
+            )
+        elif len(fields) == 7:
+            # Old partition format: reads sectors writes sectors
+            out[name.decode()] = (
+                int(fields[3]), int(fields[5]),
+                int(fields[4]) * DISK_SECTOR_SIZE, int(fields[6]) * DISK_SECTOR_SIZE,
+                0, 0, 0,
+            )
+    return out
+
+
+def disk_io_totals() -> Dict[str, Tuple[Optional[int], ...]]:
+    """Return per-disk I/O totals as plain tuples ordered like DISK_IO_FIELDS.
+
+    Linux reads /proc/diskstats directly (no readlines() copy or namedtuple
+    per device); other platforms convert psutil's counters, with ``None``
+    for fields the platform does not report (e.g. ``busy_time``).
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            return _read_diskstats()
+        except (OSError, ValueError, IndexError):
+            pass
+    return {
+        name: tuple(getattr(io, field, None) for field in DISK_IO_FIELDS)
+        for name, io in disk_io_counters().items()
+    }
+
+
 # ---------------------------- CLI helpers below ----------------------------
 
 
-def print_partitions_table(parts: List[Tuple[str, str, str, Optional[psutil._common.sdiskusage]]]):
+def print_partitions_table(parts: List[Tuple[str, str, str, Optional[psutil._common.sdiskusage], Optional[str]]]):
     headers = ["Device", "Mount", "Type", "Total", "Used", "Free", "%"]
     rows = []
-    for dev, mnt, fstype, usage in parts:
+    for dev, mnt, fstype, usage, _reason in parts:
         if usage is None:
             continue
         rows.append([
@@ -0,0 +1,74 @@
+"""
+smoothing.py — Vectorised EMA helpers for the CPU graphs and legend.
+
+- ``double_ema`` updates the per-CPU smoothing state for all CPUs in one call.
+- When Numba is installed (``pip install klv-system-monitor[jit]``) the
+  update runs as a compiled loop; otherwise an equivalent NumPy version is
+  used, so Numba stays strictly optional.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:  # optional dependency
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+
+def _double_ema_numpy(
+    raw: np.ndarray,
+    ema1: np.ndarray,
+    ema2: np.ndarray,
+    alpha: float,
+    extra: bool,
+    out: np.ndarray,
+) -> None:
+    b = 1.0 - alpha
+    ema1 *= alpha
+    ema1 += b * raw
+    ema2 *= alpha
+    ema2 += b * ema1
+    if extra:
+        np.subtract(2.0 * ema1, ema2, out=out)
+    else:
+        out[:] = ema1
+    np.maximum(out, 0.0, out=out)
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True, fastmath=True)
+    def _double_ema_jit(raw, ema1, ema2, alpha, extra, out):  # pragma: no cover
+        b = 1.0 - alpha
+        for i in range(raw.shape[0]):
+            e1 = alpha * ema1[i] + b * raw[i]
+            e2 = alpha * ema2[i] + b * e1
+            ema1[i] = e1
+            ema2[i] = e2
+            v = 2.0 * e1 - e2 if extra else e1
+            out[i] = v if v > 0.0 else 0.0
+
+
+def double_ema(
+    raw: np.ndarray,
+    ema1: np.ndarray,
+    ema2: np.ndarray,
+    alpha: float,
+    extra: bool,
+    out: np.ndarray,
+) -> None:
+    """Advance a (double) EMA for every CPU in place.
+
+    ``ema1``/``ema2`` hold the smoothing state and are updated in place;
+    ``out`` receives ``2*ema1 - ema2`` when ``extra`` is set (double-EMA),
+    otherwise ``ema1``, clamped at zero.  ``alpha=0`` disables smoothing:
+    both states and ``out`` simply follow ``raw``.
+    """
+    if HAVE_NUMBA:
+        _double_ema_jit(raw, ema1, ema2, float(alpha), bool(extra), out)
+    else:
+        _double_ema_numpy(raw, ema1, ema2, float(alpha), bool(extra), out)